@@ -4,43 +4,487 @@ Shared functions for fetching, cleaning, and saving scraped data
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import re
 import os
 from datetime import datetime
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Any, Iterable, List, Dict, Optional, Tuple
+import gzip
 import hashlib
 import tempfile
+import logging
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
+# orjson is much faster at encoding the output file; the stdlib json
+# module produces the same text if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def fetch_html(url: str, timeout: int = 60) -> Optional[BeautifulSoup]:
+# Library logger; scripts such as run_all.py configure the output.
+# For production runs, logging.basicConfig(level=logging.WARNING) keeps
+# per-page fetch messages from being formatted at all.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Prefer the C-backed lxml parser; fall back to the pure-Python one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+WRITE_BUFFER_SIZE = 1024 * 1024  # Bytes buffered per write_json flush
+POOL_MAXSIZE = 20  # Keep-alive connections kept per host
+CACHE_DIR = os.environ.get('SCRAPER_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'youth-guide')
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Shared HTTP session so repeated fetches to the same host reuse
+# pooled keep-alive connections instead of a fresh TCP+TLS handshake.
+# Responses are compressed on the wire: requests sends
+# "Accept-Encoding: gzip, deflate" and adds "br" when brotli is installed.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': USER_AGENT})
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=POOL_MAXSIZE,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+# Required opportunity fields and their defaults, in output order
+_DEFAULTS = MappingProxyType({
+    'id': '',
+    'source': '',
+    'title': '',
+    'type': 'Job',  # Default type
+    'organization': '',
+    'location': 'Namibia',  # Default location
+    'description': '',
+    'url': '',
+    'date_posted': '',
+    'verified': True
+})
+
+# Fields that must be non-blank for an opportunity to be kept
+_REQUIRED_FIELDS = ('title', 'source')
+
+# Pre-compiled patterns used on every scraped field
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Supported date formats in one alternation so the text is scanned once;
+# the outer named group that matched identifies the format
+_DATE_RE = re.compile(
+    # DD/MM/YYYY or DD-MM-YYYY
+    r'(?P<dmy>(?P<dmy_d>\d{1,2})[/-](?P<dmy_m>\d{1,2})[/-](?P<dmy_y>\d{4}))'
+    # YYYY-MM-DD (already ISO)
+    r'|(?P<iso>(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2}))'
+    # Month DD, YYYY
+    r'|(?P<mon>(?P<mon_m>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (?P<mon_d>\d{1,2}),? (?P<mon_y>\d{4}))',
+    re.IGNORECASE
+)
+
+# Opportunity type lookup table; keywords are grouped by type with the
+# highest-priority type first
+_KEYWORD_TYPE = {
+    'internship': 'Internship',
+    'intern': 'Internship',
+    'scholarship': 'Scholarship',
+    'bursary': 'Scholarship',
+    'grant': 'Scholarship',
+    'training': 'Training',
+    'course': 'Training',
+    'workshop': 'Training',
+    'programme': 'Training',
+    'program': 'Training',
+    'certification': 'Training',
+}
+_TYPE_PRIORITY = {opp_type: rank for rank, opp_type in enumerate(dict.fromkeys(_KEYWORD_TYPE.values()))}
+_TYPE_RE = re.compile('|'.join(_KEYWORD_TYPE))
+
+# Three-letter month abbreviation -> two-digit month number
+_MONTHS = {
+    name: f'{num:02d}'
+    for num, name in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1
+    )
+}
+
+# Common city name abbreviations in Namibia; matched as whole words so
+# e.g. 'wal' in 'Walvis Bay' or 'kat' in 'Katutura' are left alone
+_CITY_ABBREVIATIONS = {
+    'whk': 'Windhoek',
+    'wdh': 'Windhoek',
+    'swk': 'Swakopmund',
+    'wal': 'Walvis Bay',
+    'osh': 'Oshakati',
+    'run': 'Rundu',
+    'kat': 'Katima Mulilo'
+}
+_CITY_ABBR_RE = re.compile(r'\b(' + '|'.join(_CITY_ABBREVIATIONS) + r')\b', re.IGNORECASE)
+
+# Formatter for each _DATE_RE alternative
+_DATE_FORMATTERS = {
+    'dmy': lambda m: f"{m['dmy_y']}-{m['dmy_m'].zfill(2)}-{m['dmy_d'].zfill(2)}",
+    'iso': lambda m: f"{m['iso_y']}-{m['iso_m'].zfill(2)}-{m['iso_d'].zfill(2)}",
+    'mon': lambda m: parse_month_date(m['mon_m'], m['mon_d'], m['mon_y']),
+}
+
+
+@lru_cache(maxsize=1)
+def _today_iso(minute_bucket: int) -> str:
+    """Format the current date; cached per minute bucket"""
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def today_iso() -> str:
     """
-    Fetch HTML content from a URL and parse with BeautifulSoup
+    Get today's date as an ISO string (YYYY-MM-DD)
+    
+    The formatted string is reused for up to a minute, so callers that
+    need a default date for every record avoid re-formatting it each time.
+    """
+    return _today_iso(int(time.time() // 60))
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session used by fetch_html
+    
+    Scrapers that need requests other than a plain GET (e.g. POST search
+    forms) should use this session so they share its connection pool.
+    """
+    return _SESSION
+
+
+def warm_session(hosts: List[str], timeout: int = 5) -> None:
+    """
+    Open pooled connections to the given hosts ahead of scraping
+    
+    Resolves DNS and completes the TCP+TLS handshake for each host so the
+    first real page fetch does not pay for it. Failures are ignored.
+    
+    Args:
+        hosts: Base URLs such as 'https://jobsinnamibia.info'
+        timeout: Per-host timeout in seconds
+    """
+    def head(host: str) -> None:
+        try:
+            _SESSION.head(host, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            logger.debug("Could not warm %s: %s", host, e)
+    
+    if hosts:
+        with ThreadPoolExecutor(max_workers=min(len(hosts), POOL_MAXSIZE)) as executor:
+            list(executor.map(head, hosts))
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket rate limiter
+    
+    Allows bursts of up to `calls` requests, refilling at calls/period per
+    second, so politeness is enforced by rate instead of a fixed sleep
+    after every request. Shared between threads, waiting callers queue up
+    in the order they asked.
+    
+    Usage:
+        limiter = RateLimiter(6, 60)  # 6 requests per minute
+        limiter.acquire()
+        fetch_html(url)
+    """
+    
+    def __init__(self, calls: int, period: float):
+        """
+        Args:
+            calls: Requests allowed per period (also the burst size)
+            period: Period length in seconds
+        """
+        self.capacity = calls
+        self.rate = calls / period
+        self._tokens = float(calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available
+        
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (possibly going negative) so concurrent
+            # callers are spaced out rather than all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+def fetch_content(url: str, timeout: int = 60) -> Optional[bytes]:
+    """
+    Fetch the raw body of a URL over the shared session
+    
+    Useful when the caller parses the body itself, e.g. with its own
+    SoupStrainer or after checking it against a cache.
     
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds (default: 60s for slow sites)
         
     Returns:
-        BeautifulSoup object or None if failed
+        Response body bytes or None if failed
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     try:
-        print(f"[Scraper] Fetching: {url}")
-        response = requests.get(url, headers=headers, timeout=timeout)
+        logger.debug("Fetching: %s", url)
+        response = _SESSION.get(url, timeout=timeout)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        print(f"[Scraper] ✓ Successfully fetched {url}")
-        return soup
+        logger.debug("✓ Successfully fetched %s", url)
+        return response.content
         
     except requests.exceptions.RequestException as e:
-        print(f"[Scraper] ✗ Error fetching {url}: {str(e)}")
+        logger.warning("✗ Error fetching %s: %s", url, e)
+        return None
+
+
+def fetch_html(url: str, timeout: int = 60, strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+    """
+    Fetch HTML content from a URL and parse with BeautifulSoup
+    
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds (default: 60s for slow sites)
+        strainer: Optional SoupStrainer; only matching subtrees are parsed
+        
+    Returns:
+        BeautifulSoup object or None if failed
+    """
+    content = fetch_content(url, timeout)
+    if content is None:
         return None
+    
+    return BeautifulSoup(content, HTML_PARSER, parse_only=strainer)
+
+
+def fetch_content_batch(urls: List[str], max_workers: int = 8, timeout: int = 60) -> List[Optional[bytes]]:
+    """
+    Fetch the raw bodies of several URLs concurrently over the shared session
+    
+    Args:
+        urls: URLs to fetch
+        max_workers: Maximum number of concurrent requests
+        timeout: Request timeout in seconds per URL
+        
+    Returns:
+        List of response bodies (or None for failures), in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    # Never open more connections than the pool keeps alive
+    workers = min(max_workers, len(urls), POOL_MAXSIZE)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda url: fetch_content(url, timeout), urls))
+
+
+def fetch_html_batch(urls: List[str], max_workers: int = 8, timeout: int = 60,
+                     strainer: Optional[SoupStrainer] = None) -> List[Optional[BeautifulSoup]]:
+    """
+    Fetch several URLs concurrently over the shared session
+    
+    Args:
+        urls: URLs to fetch
+        max_workers: Maximum number of concurrent requests
+        timeout: Request timeout in seconds per URL
+        strainer: Optional SoupStrainer passed through to fetch_html
+        
+    Returns:
+        List of BeautifulSoup objects (or None for failures), in the same order as urls
+    """
+    return [
+        BeautifulSoup(content, HTML_PARSER, parse_only=strainer) if content is not None else None
+        for content in fetch_content_batch(urls, max_workers, timeout)
+    ]
+
+
+async def fetch_html_async(url: str, timeout: int = 60,
+                           strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+    """
+    Async counterpart of fetch_html for scrapers that expose scrape_async()
+    
+    The request runs in a worker thread over the shared pooled session, so
+    several awaited fetches overlap without blocking the event loop.
+    
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds (default: 60s for slow sites)
+        strainer: Optional SoupStrainer; only matching subtrees are parsed
+        
+    Returns:
+        BeautifulSoup object or None if failed
+    """
+    return await asyncio.to_thread(fetch_html, url, timeout, strainer)
+
+
+class PageCache:
+    """
+    On-disk cache of parsed pages, keyed by URL and content hash
+    
+    Requests are sent with If-None-Match / If-Modified-Since from the last
+    run. When the server answers 304, or the body's SHA-256 matches the
+    stored one, the previously parsed result is returned and the page is
+    not parsed again. Only pages seen in the current run are saved, so the
+    cache file does not grow without bound.
+    
+    Usage:
+        cache = PageCache('nieis')
+        content, parsed = cache.fetch(url)
+        if parsed is None and content is not None:
+            parsed = parse(content)
+            cache.store(url, parsed)
+        cache.save()
+    """
+    
+    def __init__(self, name: str, cache_dir: Optional[str] = None, limiter: Optional[RateLimiter] = None):
+        """
+        Load the cache file for a scraper
+        
+        Args:
+            name: Cache name, used as the file name (e.g. the scraper name)
+            cache_dir: Directory for cache files (default: SCRAPER_CACHE_DIR
+                or ~/.cache/youth-guide)
+            limiter: Optional RateLimiter acquired before every request
+        """
+        self.path = os.path.join(cache_dir or CACHE_DIR, f'{name}.json')
+        self.limiter = limiter
+        self._entries: Dict[str, Dict] = {}
+        self._seen: Dict[str, Dict] = {}
+        
+        try:
+            with open(self.path, 'rb') as f:
+                self._entries = _json_loads(f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("⚠ Ignoring unreadable page cache %s: %s", self.path, e)
+    
+    def fetch(self, url: str, timeout: int = 60) -> Tuple[Optional[bytes], Any]:
+        """
+        Fetch a page, short-circuiting when it is unchanged since the last run
+        
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            
+        Returns:
+            (content, parsed): parsed is the cached result if the page is
+            unchanged (content is then None); otherwise content is the fresh
+            body and parsed is None. Both are None if the request failed.
+        """
+        entry = self._entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        if self.limiter:
+            self.limiter.acquire()
+        
+        try:
+            logger.debug("Fetching: %s", url)
+            response = _SESSION.get(url, timeout=timeout, headers=headers)
+            if response.status_code == 304 and entry:
+                logger.debug("✓ Not modified: %s", url)
+                self._seen[url] = entry
+                return None, entry['parsed']
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.warning("✗ Error fetching %s: %s", url, e)
+            return None, None
+        
+        content = response.content
+        fresh = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'parsed': None,
+        }
+        
+        if entry and entry['sha256'] == fresh['sha256']:
+            logger.debug("✓ Unchanged content: %s", url)
+            self._seen[url] = {**fresh, 'parsed': entry['parsed']}
+            return None, entry['parsed']
+        
+        self._seen[url] = fresh
+        return content, None
+    
+    def fetch_batch(self, urls: List[str], max_workers: int = 8,
+                    timeout: int = 60) -> List[Tuple[Optional[bytes], Any]]:
+        """
+        Fetch several pages concurrently (see fetch)
+        
+        Args:
+            urls: URLs to fetch
+            max_workers: Maximum number of concurrent requests
+            timeout: Request timeout in seconds per URL
+            
+        Returns:
+            List of (content, parsed) tuples, in the same order as urls
+        """
+        if not urls:
+            return []
+        
+        workers = min(max_workers, len(urls), POOL_MAXSIZE)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda url: self.fetch(url, timeout), urls))
+    
+    def store(self, url: str, parsed: Any) -> None:
+        """
+        Record the parsed result of a page returned by fetch()
+        
+        Args:
+            url: URL that was fetched
+            parsed: JSON-serializable parse result (None is not cached)
+        """
+        if url in self._seen:
+            self._seen[url]['parsed'] = parsed
+    
+    def save(self) -> bool:
+        """
+        Write the pages seen in this run back to disk
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        entries = {url: entry for url, entry in self._seen.items() if entry['parsed'] is not None}
+        return write_json(entries, self.path, pretty=False)
 
 
 def clean_text(text: str) -> str:
@@ -56,18 +500,14 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove HTML tags if any remain
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    # Remove HTML tags if any remain; most scraped text has none, and a
+    # single substring check is far cheaper than running the regex
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text)
     
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
-    # Remove special characters that might cause issues
-    text = text.replace('\u00a0', ' ')  # non-breaking space
-    text = text.replace('\r', '')
+    # Collapse whitespace runs and trim; str.split() also treats
+    # non-breaking spaces and carriage returns as whitespace
+    text = ' '.join(text.split())
     
     return text
 
@@ -85,37 +525,17 @@ def extract_date(raw_text: str) -> Optional[str]:
     if not raw_text:
         return None
     
-    # Common date patterns
-    patterns = [
-        # DD/MM/YYYY or DD-MM-YYYY
-        (r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', lambda m: f"{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"),
-        # YYYY-MM-DD (already ISO)
-        (r'(\d{4})-(\d{1,2})-(\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
-        # Month DD, YYYY
-        (r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (\d{1,2}),? (\d{4})', 
-         lambda m: parse_month_date(m.group(1), m.group(2), m.group(3))),
-    ]
-    
-    for pattern, formatter in patterns:
-        match = re.search(pattern, raw_text, re.IGNORECASE)
-        if match:
-            try:
-                return formatter(match)
-            except:
-                continue
+    match = _DATE_RE.search(raw_text)
+    if match:
+        return _DATE_FORMATTERS[match.lastgroup](match)
     
     # Default to current date if no date found
-    return datetime.now().strftime('%Y-%m-%d')
+    return today_iso()
 
 
 def parse_month_date(month: str, day: str, year: str) -> str:
     """Helper function to parse month name to ISO date"""
-    months = {
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-        'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-    }
-    month_num = months.get(month.lower()[:3], '01')
+    month_num = _MONTHS.get(month[:3].lower(), '01')
     return f"{year}-{month_num}-{day.zfill(2)}"
 
 
@@ -134,51 +554,100 @@ def generate_id(title: str, source: str, url: str = "") -> str:
     # Create a unique string from title, source, and URL
     unique_string = f"{source}_{title}_{url}".lower()
     
-    # Generate SHA256 hash and take first 16 characters
-    hash_object = hashlib.sha256(unique_string.encode())
-    return hash_object.hexdigest()[:16]
+    # 8-byte BLAKE2b digest: a 16 hex character ID, cheaper to compute
+    # than SHA-256
+    return hashlib.blake2b(unique_string.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# Memoized variants for normalization: postings mirrored across sources
+# (and re-normalized by run_all) repeat the same field values, so their
+# cleaning and id hashing are done once per distinct input
+_clean_text_cached = lru_cache(maxsize=8192)(clean_text)
+_generate_id_cached = lru_cache(maxsize=8192)(generate_id)
+
+
+def normalize_opportunities(opportunities: List[Dict]) -> List[Dict]:
+    """
+    Normalize a batch of opportunity dictionaries so all required fields exist
+    
+    Args:
+        opportunities: Raw opportunity dictionaries
+        
+    Returns:
+        Normalized opportunities with all required fields
+    """
+    # Bind hot names locally and compute the default date once per batch
+    clean = _clean_text_cached
+    make_id = _generate_id_cached
+    defaults = _DEFAULTS
+    today = today_iso()
+    
+    normalized_opps = []
+    append = normalized_opps.append
+    
+    for opp in opportunities:
+        # Start with defaults
+        normalized = {**defaults, 'date_posted': today}
+        
+        # Update with provided values
+        for key, value in opp.items():
+            if key in normalized:
+                normalized[key] = clean(value) if isinstance(value, str) else value
+        
+        # Generate ID if not provided
+        if not normalized['id']:
+            normalized['id'] = make_id(
+                normalized['title'],
+                normalized['source'],
+                normalized['url']
+            )
+        
+        append(normalized)
+    
+    return normalized_opps
 
 
 def normalize_opportunity(opp: Dict) -> Dict:
     """
     Normalize an opportunity dictionary to ensure all required fields exist
     
+    Prefer normalize_opportunities() when normalizing many items.
+    
     Args:
         opp: Raw opportunity dictionary
         
     Returns:
         Normalized opportunity with all required fields
     """
-    required_fields = {
-        'id': '',
-        'source': '',
-        'title': '',
-        'type': 'Job',  # Default type
-        'organization': '',
-        'location': 'Namibia',  # Default location
-        'description': '',
-        'url': '',
-        'date_posted': datetime.now().strftime('%Y-%m-%d'),
-        'verified': True
-    }
-    
-    # Start with defaults
-    normalized = required_fields.copy()
-    
-    # Update with provided values
-    for key, value in opp.items():
-        if key in normalized:
-            normalized[key] = clean_text(str(value)) if isinstance(value, str) else value
-    
-    # Generate ID if not provided
-    if not normalized['id']:
-        normalized['id'] = generate_id(
-            normalized['title'],
-            normalized['source'],
-            normalized['url']
-        )
+    return normalize_opportunities([opp])[0]
+
+
+def matches_normalized(opp: Dict, normalized: Dict) -> bool:
+    """
+    Check whether normalizing opp would reproduce normalized exactly
+    
+    Lets callers reuse an already-normalized copy of an unchanged
+    opportunity (e.g. from the previous run) without normalizing it
+    again. Every field normalization reads must already hold the value
+    it would produce; cleaning is idempotent, so equal values stay equal.
+    
+    Args:
+        opp: Raw opportunity dictionary
+        normalized: A previously normalized opportunity
+        
+    Returns:
+        True if normalize_opportunity(opp) would equal normalized
+    """
+    # A missing ID is generated and a missing date becomes today's, so
+    # neither can be assumed to match
+    if not opp.get('id') or not opp.get('date_posted'):
+        return False
     
-    return normalized
+    for field, default in _DEFAULTS.items():
+        if opp.get(field, default) != normalized.get(field):
+            return False
+    
+    return True
 
 
 def remove_duplicates(opportunities: List[Dict]) -> List[Dict]:
@@ -191,16 +660,86 @@ def remove_duplicates(opportunities: List[Dict]) -> List[Dict]:
     Returns:
         Deduplicated list
     """
-    seen_ids = set()
-    unique_opps = []
+    # Dict keeps insertion order, so the first occurrence of each ID wins
+    unique_opps = {}
     
     for opp in opportunities:
         opp_id = opp.get('id')
-        if opp_id and opp_id not in seen_ids:
-            seen_ids.add(opp_id)
-            unique_opps.append(opp)
+        if opp_id and opp_id not in unique_opps:
+            unique_opps[opp_id] = opp
+    
+    logger.info("Removed %d duplicates", len(opportunities) - len(unique_opps))
+    return list(unique_opps.values())
+
+
+def _shingles(text: str, size: int = 5) -> set:
+    """Character n-gram shingles of lowercased, cleaned text"""
+    text = clean_text(text).lower()
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def remove_near_duplicates(opportunities: List[Dict], threshold: float = 0.9, num_perm: int = 128) -> List[Dict]:
+    """
+    Remove near-duplicate opportunities (e.g. the same posting mirrored on
+    several sites) using MinHash + LSH over title and description shingles
+    
+    Requires the optional `datasketch` package; if it is not installed the
+    list is returned unchanged.
+    
+    Args:
+        opportunities: List of opportunity dictionaries
+        threshold: Estimated Jaccard similarity above which two items are duplicates
+        num_perm: Number of MinHash permutations
+        
+    Returns:
+        List with near-duplicates removed, keeping the most recently posted copy
+    """
+    try:
+        from datasketch import MinHash, MinHashLSH
+    except ImportError:
+        logger.warning("⚠ datasketch not installed, skipping near-duplicate removal")
+        return opportunities
+    
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+    keep = set()
+    
+    # Visit newest first so the most recent copy of a posting is the one kept
+    order = sorted(
+        range(len(opportunities)),
+        key=lambda i: opportunities[i].get('date_posted') or '',
+        reverse=True
+    )
     
-    print(f"[Scraper] Removed {len(opportunities) - len(unique_opps)} duplicates")
+    # Build all signatures in one batch: permutations are generated once
+    # and each document's shingles are hashed in a single vectorized update
+    shingle_sets = []
+    for idx in order:
+        opp = opportunities[idx]
+        text = f"{opp.get('title', '')} {opp.get('description', '')}"
+        shingle_sets.append([shingle.encode('utf-8') for shingle in _shingles(text)])
+    
+    if hasattr(MinHash, 'bulk'):
+        minhashes = MinHash.bulk(shingle_sets, num_perm=num_perm)
+    else:
+        # MinHash.bulk was added in datasketch 1.5.2
+        minhashes = []
+        for shingles in shingle_sets:
+            minhash = MinHash(num_perm=num_perm)
+            for shingle in shingles:
+                minhash.update(shingle)
+            minhashes.append(minhash)
+    
+    for idx, minhash in zip(order, minhashes):
+        if lsh.query(minhash):
+            continue
+        
+        lsh.insert(idx, minhash)
+        keep.add(idx)
+    
+    unique_opps = [opp for idx, opp in enumerate(opportunities) if idx in keep]
+    logger.info("Removed %d near-duplicates", len(opportunities) - len(unique_opps))
     return unique_opps
 
 
@@ -208,22 +747,116 @@ def validate_opportunity(opp: Dict) -> bool:
     """
     Validate that an opportunity has minimum required data
     
+    Prefer validate_opportunities() when validating many items.
+    
     Args:
         opp: Opportunity dictionary
         
     Returns:
         True if valid, False otherwise
     """
-    required = ['title', 'source']
-    
-    for field in required:
-        if not opp.get(field) or not str(opp.get(field)).strip():
+    for field in _REQUIRED_FIELDS:
+        value = opp.get(field)
+        if not value or not str(value).strip():
             return False
     
     return True
 
 
-def write_json(data: Dict, filepath: str, pretty: bool = True) -> bool:
+def validate_opportunities(opportunities: Iterable[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Validate a batch of opportunities in a single pass
+    
+    Args:
+        opportunities: Opportunity dictionaries
+        
+    Returns:
+        Tuple of (valid opportunities, invalid opportunities), each in
+        input order
+    """
+    is_valid = validate_opportunity
+    valid = []
+    invalid = []
+    
+    for opp in opportunities:
+        (valid if is_valid(opp) else invalid).append(opp)
+    
+    return valid, invalid
+
+
+def _json_loads(raw: bytes):
+    """Decode JSON bytes with orjson when available"""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _jsonl_line(record: Dict) -> bytes:
+    """Encode one record as a compact UTF-8 JSON line"""
+    if orjson:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _iter_stdlib_json_chunks(data, pretty: bool):
+    """
+    Yield the stdlib json encoding of data in pieces (fallback without orjson)
+    
+    Produces the same text as the orjson path: UTF-8, non-ASCII unescaped,
+    two-space indent when pretty and no whitespace otherwise.
+    """
+    encoder = json.JSONEncoder(
+        ensure_ascii=False,
+        indent=2 if pretty else None,
+        separators=(',', ': ') if pretty else (',', ':')
+    )
+    for chunk in encoder.iterencode(data):
+        yield chunk.encode('utf-8')
+
+
+def _iter_json_chunks(data, option: int, pretty: bool):
+    """
+    Yield the orjson encoding of data in pieces
+    
+    Top-level lists inside a dict (e.g. 'opportunities') are encoded one
+    item at a time, so only a single record is held as bytes at once.
+    The concatenated output is identical to orjson.dumps(data, option).
+    """
+    if not isinstance(data, dict) or not data or not all(isinstance(key, str) for key in data):
+        yield orjson.dumps(data, option=option)
+        return
+    
+    # Separators and the re-indent applied to nested values
+    if pretty:
+        open_obj, close_obj, key_sep, item_sep = b'{\n  ', b'\n}', b': ', b',\n  '
+        list_open, list_close, list_sep = b'[\n    ', b'\n  ]', b',\n    '
+        level1, level2 = b'\n  ', b'\n    '
+    else:
+        open_obj, close_obj, key_sep, item_sep = b'{', b'}', b':', b','
+        list_open, list_close, list_sep = b'[', b']', b','
+        level1 = level2 = b''
+    
+    def encode(value, indent):
+        encoded = orjson.dumps(value, option=option)
+        return encoded.replace(b'\n', indent) if indent else encoded
+    
+    yield open_obj
+    for index, (key, value) in enumerate(data.items()):
+        if index:
+            yield item_sep
+        yield orjson.dumps(key) + key_sep
+        
+        if isinstance(value, list) and value:
+            yield list_open
+            for item_index, item in enumerate(value):
+                if item_index:
+                    yield list_sep
+                yield encode(item, level2)
+            yield list_close
+        else:
+            yield encode(value, level1)
+    yield close_obj
+
+
+def write_json(data: Dict, filepath: str, pretty: bool = True, compress: bool = False) -> bool:
     """
     Write data to JSON file using atomic write (temp file + rename)
     
@@ -231,6 +864,7 @@ def write_json(data: Dict, filepath: str, pretty: bool = True) -> bool:
         data: Dictionary to write
         filepath: Target file path
         pretty: Whether to use pretty printing
+        compress: Gzip the output (give filepath a .gz extension)
         
     Returns:
         True if successful, False otherwise
@@ -245,54 +879,125 @@ def write_json(data: Dict, filepath: str, pretty: bool = True) -> bool:
             suffix='.tmp'
         )
         
-        with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+        if orjson:
+            # orjson emits UTF-8 bytes without escaping non-ASCII characters,
+            # matching the previous ensure_ascii=False output
+            option = orjson.OPT_NON_STR_KEYS
             if pretty:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                option |= orjson.OPT_INDENT_2
+            chunks = _iter_json_chunks(data, option, pretty)
+        else:
+            chunks = _iter_stdlib_json_chunks(data, pretty)
+        
+        # Stream through a 1 MiB buffer instead of building the whole
+        # document in memory first
+        with os.fdopen(temp_fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            if compress:
+                # mtime=0 keeps the output identical for identical data
+                with gzip.GzipFile(fileobj=f, mode='wb', mtime=0) as gz:
+                    for chunk in chunks:
+                        gz.write(chunk)
             else:
-                json.dump(data, f, ensure_ascii=False)
+                for chunk in chunks:
+                    f.write(chunk)
+            # Make sure the data is on disk before the rename publishes it
+            f.flush()
+            os.fsync(f.fileno())
         
         # Atomic rename
         os.replace(temp_path, filepath)
         
-        print(f"[Scraper] ✓ Successfully wrote {filepath}")
-        print(f"[Scraper]   File size: {os.path.getsize(filepath)} bytes")
+        logger.info("✓ Successfully wrote %s", filepath)
+        logger.info("  File size: %d bytes", os.path.getsize(filepath))
         return True
         
     except Exception as e:
-        print(f"[Scraper] ✗ Error writing {filepath}: {str(e)}")
+        logger.error("✗ Error writing %s: %s", filepath, e)
         # Clean up temp file if it exists
         if 'temp_path' in locals() and os.path.exists(temp_path):
             os.remove(temp_path)
         return False
 
 
+def write_jsonl(records: Iterable[Dict], filepath: str) -> Optional[int]:
+    """
+    Stream records to a newline-delimited JSON file using atomic write
+    
+    Records are encoded and written one at a time as the iterable yields
+    them, so a generator of scraped jobs never has to be held in memory.
+    
+    Args:
+        records: Iterable of JSON-serializable dicts
+        filepath: Target file path
+        
+    Returns:
+        Number of records written, or None if writing failed
+    """
+    try:
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        
+        # Write to temporary file first
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(filepath) or '.',
+            suffix='.tmp'
+        )
+        
+        count = 0
+        with os.fdopen(temp_fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for record in records:
+                f.write(_jsonl_line(record))
+                count += 1
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Atomic rename
+        os.replace(temp_path, filepath)
+        
+        logger.info("✓ Successfully wrote %d records to %s", count, filepath)
+        return count
+        
+    except Exception as e:
+        logger.error("✗ Error writing %s: %s", filepath, e)
+        # Clean up temp file if it exists
+        if 'temp_path' in locals() and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+
+
+@lru_cache(maxsize=1024)
 def get_opportunity_type(text: str) -> str:
     """
     Determine opportunity type from text
     
+    Memoized: listings repeat the same titles and categories heavily.
+    
     Args:
         text: Text to analyze (title, description, etc.)
         
     Returns:
         One of: Job, Training, Scholarship, Internship
     """
-    text_lower = text.lower()
+    best = None
     
-    # Check for keywords
-    if any(word in text_lower for word in ['internship', 'intern']):
-        return 'Internship'
-    elif any(word in text_lower for word in ['scholarship', 'bursary', 'grant']):
-        return 'Scholarship'
-    elif any(word in text_lower for word in ['training', 'course', 'workshop', 'program', 'programme', 'certification']):
-        return 'Training'
-    else:
-        return 'Job'
+    # One pass over the text; each keyword hit is resolved by table lookup
+    for match in _TYPE_RE.finditer(text.lower()):
+        opp_type = _KEYWORD_TYPE[match.group()]
+        if opp_type == 'Internship':
+            return opp_type
+        if best is None or _TYPE_PRIORITY[opp_type] < _TYPE_PRIORITY[best]:
+            best = opp_type
+    
+    return best or 'Job'
 
 
+@lru_cache(maxsize=1024)
 def format_location(location: str) -> str:
     """
     Normalize location string
     
+    Memoized: a run sees only a handful of distinct locations.
+    
     Args:
         location: Raw location text
         
@@ -302,37 +1007,36 @@ def format_location(location: str) -> str:
     if not location:
         return 'Namibia'
     
-    # Common city names in Namibia
-    cities = {
-        'whk': 'Windhoek',
-        'wdh': 'Windhoek',
-        'swk': 'Swakopmund',
-        'wal': 'Walvis Bay',
-        'osh': 'Oshakati',
-        'run': 'Rundu',
-        'kat': 'Katima Mulilo'
-    }
-    
-    location_clean = clean_text(location)
-    
-    # Replace abbreviations
-    for abbr, full in cities.items():
-        if abbr in location_clean.lower():
-            return full
+    # Expand abbreviations in a single pass
+    location_clean = _CITY_ABBR_RE.sub(lambda m: _CITY_ABBREVIATIONS[m.group(1).lower()], clean_text(location))
     
     return location_clean or 'Namibia'
 
 
 # Export all utility functions
 __all__ = [
+    'PageCache',
+    'RateLimiter',
+    'fetch_content',
+    'fetch_content_batch',
     'fetch_html',
+    'fetch_html_batch',
+    'fetch_html_async',
+    'get_session',
+    'warm_session',
     'clean_text',
     'extract_date',
+    'today_iso',
     'generate_id',
     'normalize_opportunity',
+    'normalize_opportunities',
+    'matches_normalized',
     'remove_duplicates',
+    'remove_near_duplicates',
     'validate_opportunity',
+    'validate_opportunities',
     'write_json',
+    'write_jsonl',
     'get_opportunity_type',
     'format_location'
 ]
@@ -5,107 +5,121 @@ Returns dummy data in the correct format
 
 from typing import List, Dict
 from datetime import datetime, timedelta
+from types import MappingProxyType
+import logging
 import random
+import sys
+import time
 
 
-def scrape() -> List[Dict]:
+# Module logger; run_all.py (or the test harness below) configures output
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Example job listings
+_JOBS = (
+    MappingProxyType({
+        'title': 'Junior Software Developer',
+        'organization': 'Tech Namibia',
+        'location': 'Windhoek',
+        'description': 'We are looking for a junior developer to join our team. Requirements: Basic knowledge of Python and JavaScript.',
+        'type': 'Job',
+    }),
+    MappingProxyType({
+        'title': 'Sales Assistant',
+        'organization': 'Retail Solutions',
+        'location': 'Swakopmund',
+        'description': 'Full-time sales position in a busy retail store. No experience required, training provided.',
+        'type': 'Job',
+    }),
+    MappingProxyType({
+        'title': 'Security Guard',
+        'organization': 'SafeGuard Services',
+        'location': 'Walvis Bay',
+        'description': 'Night shift security position. Must be 18+ and have PSIRA certificate.',
+        'type': 'Job',
+    }),
+)
+
+# Example training programs
+_TRAININGS = (
+    MappingProxyType({
+        'title': 'Plumbing Skills Training',
+        'organization': 'National Youth Service',
+        'location': 'Windhoek',
+        'description': 'Free 6-month plumbing certification program for youth aged 18-35. All materials provided.',
+        'type': 'Training',
+    }),
+    MappingProxyType({
+        'title': 'Digital Marketing Course',
+        'organization': 'Future Skills Academy',
+        'location': 'Online',
+        'description': 'Learn social media marketing, SEO, and content creation. 8-week online course.',
+        'type': 'Training',
+    }),
+)
+
+# Example internships
+_INTERNSHIPS = (
+    MappingProxyType({
+        'title': 'Business Administration Internship',
+        'organization': 'City Council',
+        'location': 'Windhoek',
+        'description': '3-month paid internship in municipal administration. Open to recent graduates.',
+        'type': 'Internship',
+    }),
+)
+
+# Example scholarships
+_SCHOLARSHIPS = (
+    MappingProxyType({
+        'title': 'Technical College Bursary',
+        'organization': 'Ministry of Education',
+        'location': 'Nationwide',
+        'description': 'Full bursary for technical and vocational training. Covers tuition and accommodation.',
+        'type': 'Scholarship',
+    }),
+)
+
+# Combine all examples once; only dates and IDs change per call
+_ALL_EXAMPLES = _JOBS + _TRAININGS + _INTERNSHIPS + _SCHOLARSHIPS
+
+# Use actual Namibian job boards or government websites for URLs
+# These are placeholder URLs - should be replaced with actual source URLs
+_BASE_URLS = MappingProxyType({
+    'Job': 'https://jobsinnamibia.info',
+    'Training': 'https://www.nta.com.na',
+    'Internship': 'https://mti.gov.na',
+    'Scholarship': 'https://www.nsfaf.na'
+})
+
+
+def scrape(simulate_delay: bool = False) -> List[Dict]:
     """
     Example scraper that returns dummy opportunities
     
+    Args:
+        simulate_delay: Sleep briefly to mimic a network-bound scraper
+    
     Returns:
         List of opportunity dictionaries
     """
-    print("[Scraper] Running example_scraper.py...")
+    logger.info("Running example_scraper.py...")
     
     # Simulate scraping delay
-    import time
-    time.sleep(0.5)
+    if simulate_delay:
+        time.sleep(0.5)
     
     # Generate dummy opportunities
     opportunities = []
-    
-    # Example job listings
-    jobs = [
-        {
-            'title': 'Junior Software Developer',
-            'organization': 'Tech Namibia',
-            'location': 'Windhoek',
-            'description': 'We are looking for a junior developer to join our team. Requirements: Basic knowledge of Python and JavaScript.',
-            'type': 'Job',
-        },
-        {
-            'title': 'Sales Assistant',
-            'organization': 'Retail Solutions',
-            'location': 'Swakopmund',
-            'description': 'Full-time sales position in a busy retail store. No experience required, training provided.',
-            'type': 'Job',
-        },
-        {
-            'title': 'Security Guard',
-            'organization': 'SafeGuard Services',
-            'location': 'Walvis Bay',
-            'description': 'Night shift security position. Must be 18+ and have PSIRA certificate.',
-            'type': 'Job',
-        }
-    ]
-    
-    # Example training programs
-    trainings = [
-        {
-            'title': 'Plumbing Skills Training',
-            'organization': 'National Youth Service',
-            'location': 'Windhoek',
-            'description': 'Free 6-month plumbing certification program for youth aged 18-35. All materials provided.',
-            'type': 'Training',
-        },
-        {
-            'title': 'Digital Marketing Course',
-            'organization': 'Future Skills Academy',
-            'location': 'Online',
-            'description': 'Learn social media marketing, SEO, and content creation. 8-week online course.',
-            'type': 'Training',
-        }
-    ]
-    
-    # Example internships
-    internships = [
-        {
-            'title': 'Business Administration Internship',
-            'organization': 'City Council',
-            'location': 'Windhoek',
-            'description': '3-month paid internship in municipal administration. Open to recent graduates.',
-            'type': 'Internship',
-        }
-    ]
-    
-    # Example scholarships
-    scholarships = [
-        {
-            'title': 'Technical College Bursary',
-            'organization': 'Ministry of Education',
-            'location': 'Nationwide',
-            'description': 'Full bursary for technical and vocational training. Covers tuition and accommodation.',
-            'type': 'Scholarship',
-        }
-    ]
-    
-    # Combine all examples
-    all_examples = jobs + trainings + internships + scholarships
+    now = datetime.now()
     
     # Generate opportunities with proper structure
-    for idx, example in enumerate(all_examples):
+    for idx, example in enumerate(_ALL_EXAMPLES):
         # Generate dates (recent postings)
         days_ago = random.randint(1, 30)
-        date_posted = (datetime.now() - timedelta(days=days_ago)).strftime('%Y-%m-%d')
-        
-        # Use actual Namibian job boards or government websites for URLs
-        # These are placeholder URLs - should be replaced with actual source URLs
-        base_urls = {
-            'Job': 'https://jobsinnamibia.info',
-            'Training': 'https://www.nta.com.na',
-            'Internship': 'https://mti.gov.na',
-            'Scholarship': 'https://www.nsfaf.na'
-        }
+        date_posted = (now - timedelta(days=days_ago)).strftime('%Y-%m-%d')
         
         opportunity = {
             'id': f'example_{idx + 1}',
@@ -116,20 +130,22 @@ def scrape() -> List[Dict]:
             'location': example['location'],
             'description': example['description'],
             # Use the appropriate base URL for the opportunity type
-            'url': base_urls.get(example['type'], 'https://jobsinnamibia.info'),
+            'url': _BASE_URLS.get(example['type'], 'https://jobsinnamibia.info'),
             'date_posted': date_posted,
             'verified': True
         }
         
         opportunities.append(opportunity)
     
-    print(f"[Scraper] example_scraper.py returned {len(opportunities)} opportunities")
+    logger.info("example_scraper.py returned %s opportunities", len(opportunities))
     
     return opportunities
 
 
 if __name__ == '__main__':
     # Test the scraper
+    logging.basicConfig(level=logging.INFO, format='[Scraper] %(message)s', stream=sys.stdout)
+    
     results = scrape()
     print(f"\nScraped {len(results)} opportunities:")
     for opp in results:
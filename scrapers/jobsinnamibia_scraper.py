@@ -6,49 +6,128 @@ Purpose: Academic research - Youth unemployment study
 Target: https://jobsinnamibia.info/
 Legal: Public job listings, robots.txt compliant, research fair use
 
-This scraper uses Selenium with Chrome WebDriver to handle dynamic content
-and extracts job listings from JobsInNamibia.info for the YouthGuide NA project.
+This scraper fetches the WordPress listing pages over plain HTTP and parses
+them with BeautifulSoup - the job markup is fully present in the initial
+HTML. Selenium with Chrome WebDriver is kept as a fallback (--use-selenium)
+for when the site starts requiring JavaScript.
+It extracts job listings from JobsInNamibia.info for the YouthGuide NA project.
 
 Academic Research:
 "Designing an AI Enhanced Chatbot System to Connect Unemployed Youth 
 in Havana with Tailored Opportunities"
 
-Rate Limiting: 2-3 second delays between page loads
+Rate Limiting: token bucket - bursts of up to 5 page loads, averaging one per 2 seconds
 Max Pages: Configurable (default: 5 for testing, can scrape all 639+ pages)
 """
 
+from __future__ import annotations
+
 import sys
 import os
-import time
+import atexit
+import logging
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+from urllib.parse import urljoin
 
-# Selenium imports
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+# Selenium is only needed for the --use-selenium fallback
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
 
 # Import our base scraper utilities
 sys.path.append(os.path.dirname(__file__))
+from bs4 import BeautifulSoup
 from base_scraper import (
+    HTML_PARSER,
+    PageCache,
+    RateLimiter,
+    fetch_html,
     clean_text,
     extract_date,
     generate_id,
-    normalize_opportunity,
+    normalize_opportunities,
     format_location,
-    get_opportunity_type
+    get_opportunity_type,
+    write_jsonl
 )
 
+# Module logger; run_all.py (or the test harness below) configures output
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 # Constants
 BASE_URL = "https://jobsinnamibia.info"
 MAX_PAGES = 5  # Set to None to scrape all pages (639+), or a number for testing
-PAGE_LOAD_DELAY = 2  # Seconds between page loads
+PAGE_LOAD_DELAY = 2  # Average seconds between page loads
+PAGE_LOAD_BURST = 5  # Page loads allowed back-to-back before throttling
 TIMEOUT = 30  # Seconds to wait for elements
+CONTENT_TIMEOUT = 5  # Seconds to wait for late-rendered listing details
+
+# Resources the browser never needs to download (the scraper reads text only)
+BLOCKED_RESOURCES = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.css",
+]
+
+# Relative "posted ago" dates, e.g. "3 days ago"
+_POSTED_RE = re.compile(r'(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago')
+_UNIT_TO_DELTA = {
+    'second': lambda n: timedelta(seconds=n),
+    'minute': lambda n: timedelta(minutes=n),
+    'hour': lambda n: timedelta(hours=n),
+    'day': lambda n: timedelta(days=n),
+    'week': lambda n: timedelta(weeks=n),
+    'month': lambda n: timedelta(days=n * 30),
+    'year': lambda n: timedelta(days=n * 365),
+}
+# Exact strings that make up most listings, answered without the regex;
+# each gives the same date the regex path (or its today fallback) would
+_COMMON_POSTED = {
+    'today': timedelta(0),
+    **{f"{n} hour{'s' if n > 1 else ''} ago": timedelta(hours=n) for n in range(1, 24)},
+    **{f"{n} day{'s' if n > 1 else ''} ago": timedelta(days=n) for n in range(1, 31)},
+}
+_PREFIX_RE = re.compile(r'^Permanent link to:\s*["\']?')
+
+# Highest numeric pagination link, or 0 if there is none
+TOTAL_PAGES_JS = """
+return [...document.querySelectorAll('.pagination .page-numbers')]
+  .map(e => e.textContent.trim())
+  .filter(t => /^\\d+$/.test(t))
+  .reduce((max, t) => Math.max(max, parseInt(t, 10)), 0);
+"""
+
+# Browser-side equivalent of extract_listing_fields(), used by the Selenium path
+LISTING_FIELDS_JS = """
+const text = (root, sel) => { const el = root.querySelector(sel); return el ? el.textContent : null; };
+return [...document.querySelectorAll('article.loadmore-item.noo_job')].map(a => {
+  const link = a.querySelector('h3.loop-item-title a');
+  const time = a.querySelector('time[datetime]');
+  return {
+    title: link ? (link.getAttribute('title') || link.textContent) : null,
+    url: link ? link.href : null,
+    location: text(a, "span[itemprop='jobLocation'] a"),
+    closing: time ? (time.getAttribute('datetime') || time.textContent) : null,
+    posted: text(a, 'span.job-date-ago'),
+    category: text(a, 'span.job-category a'),
+    excerpt: text(a, '.job-excerpt, .entry-content'),
+  };
+});
+"""
+
+# Token bucket shared by the HTTP and Selenium paths
+_LIMITER = RateLimiter(PAGE_LOAD_BURST, PAGE_LOAD_BURST * PAGE_LOAD_DELAY)
+
+_DRIVER: Optional[webdriver.Chrome] = None  # Shared browser, see get_driver()
 
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
@@ -76,16 +155,63 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     # Suppress logging
     chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
     
+    # Never download images - the scraper only reads text
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2
+    })
+    
     try:
         driver = webdriver.Chrome(options=chrome_options)
         driver.set_page_load_timeout(TIMEOUT)
+        
+        # Block images, stylesheets and fonts at the network layer too
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCES})
+        except WebDriverException as e:
+            logger.warning("Could not block static resources: %s", e)
+        
         return driver
     except WebDriverException as e:
-        print(f"[Error] Failed to initialize Chrome WebDriver: {e}")
-        print("[Info] Make sure chromedriver is installed and in your PATH")
+        logger.error("Failed to initialize Chrome WebDriver: %s", e)
+        logger.info("Make sure chromedriver is installed and in your PATH")
         sys.exit(1)
 
 
+def get_driver() -> webdriver.Chrome:
+    """
+    Get the shared headless Chrome WebDriver, starting it on first use.
+    
+    The browser is kept alive between scrape() calls so repeated runs skip
+    Chrome's startup and connection warm-up; it is closed at interpreter exit.
+    
+    Returns:
+        Chrome WebDriver instance
+    """
+    global _DRIVER
+    
+    if _DRIVER is None:
+        logger.info("Initializing Chrome WebDriver (headless mode)...")
+        _DRIVER = setup_driver(headless=True)
+        atexit.register(_shutdown_driver)
+    
+    return _DRIVER
+
+
+def _shutdown_driver() -> None:
+    """Close the shared WebDriver, if one is running."""
+    global _DRIVER
+    
+    if _DRIVER is not None:
+        logger.info("Closing Chrome WebDriver...")
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+        _DRIVER = None
+
+
 def get_total_pages(driver: webdriver.Chrome) -> int:
     """
     Extract the total number of pages from pagination.
@@ -102,158 +228,147 @@ def get_total_pages(driver: webdriver.Chrome) -> int:
             EC.presence_of_element_located((By.CLASS_NAME, "pagination"))
         )
         
-        # Find all page number links
-        page_links = driver.find_elements(By.CSS_SELECTOR, ".pagination .page-numbers")
-        
-        # Extract numbers and find the maximum
-        page_numbers = []
-        for link in page_links:
-            text = link.text.strip()
-            if text.isdigit():
-                page_numbers.append(int(text))
+        # Let the browser find the highest page number in one WebDriver call
+        total = driver.execute_script(TOTAL_PAGES_JS) or 0
         
-        if page_numbers:
-            total = max(page_numbers)
-            print(f"[Scraper] Found {total} total pages")
+        if total:
+            logger.info("Found %s total pages", total)
             return total
         else:
-            print("[Warning] Could not determine total pages, defaulting to 1")
+            logger.warning("Could not determine total pages, defaulting to 1")
             return 1
     
     except TimeoutException:
-        print("[Warning] Pagination not found, assuming single page")
+        logger.warning("Pagination not found, assuming single page")
         return 1
     except Exception as e:
-        print(f"[Warning] Error getting total pages: {e}")
+        logger.warning("Error getting total pages: %s", e)
         return 1
 
 
-def parse_posted_ago(text: str) -> str:
+def parse_posted_ago(text: str, now: Optional[datetime] = None) -> str:
     """
     Parse relative date like "2 days ago" to ISO date.
     
     Args:
         text: Relative date string
+        now: Reference time (default: the current time)
     
     Returns:
         ISO formatted date string
     """
+    if now is None:
+        now = datetime.now()
     if not text:
-        return datetime.now().date().isoformat()
+        return now.date().isoformat()
     
     text = text.lower().strip()
     
+    # Fast path: "today", "1 day ago", "5 hours ago", ...
+    delta = _COMMON_POSTED.get(text)
+    if delta is not None:
+        return (now - delta).date().isoformat()
+    
     try:
         # Pattern: "X days ago", "X hours ago", "X weeks ago", etc.
-        match = re.search(r'(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago', text)
+        match = _POSTED_RE.search(text)
         
         if match:
-            number = int(match.group(1))
-            unit = match.group(2)
-            
-            if unit == 'second':
-                delta = timedelta(seconds=number)
-            elif unit == 'minute':
-                delta = timedelta(minutes=number)
-            elif unit == 'hour':
-                delta = timedelta(hours=number)
-            elif unit == 'day':
-                delta = timedelta(days=number)
-            elif unit == 'week':
-                delta = timedelta(weeks=number)
-            elif unit == 'month':
-                delta = timedelta(days=number * 30)
-            elif unit == 'year':
-                delta = timedelta(days=number * 365)
-            else:
-                delta = timedelta(days=0)
-            
-            date = datetime.now() - delta
+            delta = _UNIT_TO_DELTA[match.group(2)](int(match.group(1)))
+            date = now - delta
             return date.date().isoformat()
     
     except Exception as e:
-        print(f"[Warning] Could not parse date '{text}': {e}")
+        logger.warning("Could not parse date '%s': %s", text, e)
     
-    return datetime.now().date().isoformat()
+    return now.date().isoformat()
 
 
-def parse_job_listing(article) -> Optional[Dict[str, str]]:
+def extract_listing_fields(article) -> Dict[str, Optional[str]]:
     """
-    Extract job details from a single article element.
+    Pull the raw listing fields out of a job article.
+    
+    Produces the same record shape as LISTING_FIELDS_JS does in the browser.
     
     Args:
-        article: Selenium WebElement for the job article
+        article: BeautifulSoup Tag for the job article
+    
+    Returns:
+        Dictionary of raw field strings (None where an element is missing)
+    """
+    def text(selector: str) -> Optional[str]:
+        elem = article.select_one(selector)
+        return elem.get_text(" ") if elem else None
+    
+    title_elem = article.select_one("h3.loop-item-title a")
+    time_elem = article.select_one("time[datetime]")
+    
+    return {
+        "title": (title_elem.get("title") or title_elem.get_text()) if title_elem else None,
+        "url": title_elem.get("href") if title_elem else None,
+        "location": text("span[itemprop='jobLocation'] a"),
+        "closing": (time_elem.get("datetime") or time_elem.get_text()) if time_elem else None,
+        "posted": text("span.job-date-ago"),
+        "category": text("span.job-category a"),
+        "excerpt": text(".job-excerpt, .entry-content"),
+    }
+
+
+def parse_job_listing(record: Dict[str, Optional[str]], now: Optional[datetime] = None) -> Optional[Dict[str, str]]:
+    """
+    Build a job from the raw fields of a single listing.
+    
+    Args:
+        record: Raw listing fields, from extract_listing_fields() or LISTING_FIELDS_JS
+        now: Reference time for relative dates (default: the current time)
     
     Returns:
         Dictionary with job details, or None if parsing fails
     """
     try:
         # Extract title
-        try:
-            title_elem = article.find_element(By.CSS_SELECTOR, "h3.loop-item-title a")
-            title = clean_text(title_elem.get_attribute("title") or title_elem.text)
-            # Remove "Permanent link to:" prefix if present
-            title = re.sub(r'^Permanent link to:\s*["\']?', '', title).strip('"\'')
-            job_url = title_elem.get_attribute("href")
-        except NoSuchElementException:
-            print("[Warning] Could not find job title, skipping")
-            return None
+        title = clean_text(record.get("title") or "")
+        # Remove "Permanent link to:" prefix if present
+        title = _PREFIX_RE.sub('', title).strip('"\'')
+        job_url = record.get("url")
         
         if not title or not job_url:
+            logger.warning("Could not find job title, skipping")
             return None
         
+        job_url = urljoin(BASE_URL, job_url)
+        
         # Extract location
         location = "Namibia"  # Default
-        try:
-            location_elem = article.find_element(By.CSS_SELECTOR, "span[itemprop='jobLocation'] a")
-            location = clean_text(location_elem.text)
+        if record.get("location"):
+            location = clean_text(record["location"])
             location = format_location(location)
-        except NoSuchElementException:
-            pass
         
-        # Extract closing date
+        # Extract closing date (datetime attribute, or the element's text)
         closing_date = None
-        try:
-            time_elem = article.find_element(By.CSS_SELECTOR, "time[datetime]")
-            datetime_attr = time_elem.get_attribute("datetime")
-            if datetime_attr:
-                # Try to parse the datetime attribute
-                closing_date = extract_date(datetime_attr)
-            else:
-                # Fallback to text content
-                date_text = time_elem.text.strip()
-                closing_date = extract_date(date_text)
-        except NoSuchElementException:
-            pass
+        if record.get("closing"):
+            closing_date = extract_date(record["closing"].strip())
         
         # Extract posted ago date
-        posted_date = datetime.now().date().isoformat()
-        try:
-            posted_elem = article.find_element(By.CSS_SELECTOR, "span.job-date-ago")
-            posted_ago_text = clean_text(posted_elem.text)
-            posted_date = parse_posted_ago(posted_ago_text)
-        except NoSuchElementException:
-            pass
+        if now is None:
+            now = datetime.now()
+        posted_date = now.date().isoformat()
+        if record.get("posted"):
+            posted_ago_text = clean_text(record["posted"])
+            posted_date = parse_posted_ago(posted_ago_text, now)
         
         # Extract category
         category = "General"  # Default
-        try:
-            category_elem = article.find_element(By.CSS_SELECTOR, "span.job-category a")
-            category = clean_text(category_elem.text)
-        except NoSuchElementException:
-            pass
+        if record.get("category"):
+            category = clean_text(record["category"])
         
         # Extract description snippet (if available)
         description = f"Category: {category}."
         if closing_date:
             description += f" Closing date: {closing_date}."
-        try:
-            excerpt_elem = article.find_element(By.CSS_SELECTOR, ".job-excerpt, .entry-content")
-            excerpt = clean_text(excerpt_elem.text)
-            if excerpt:
-                description = excerpt[:200] + ("..." if len(excerpt) > 200 else "")
-        except NoSuchElementException:
-            pass
+        excerpt = clean_text(record.get("excerpt") or "")
+        if excerpt:
+            description = excerpt[:200] + ("..." if len(excerpt) > 200 else "")
         
         # Determine organization from title or category
         organization = "Unknown"
@@ -286,10 +401,120 @@ def parse_job_listing(article) -> Optional[Dict[str, str]]:
         return job
     
     except Exception as e:
-        print(f"[Warning] Error parsing job listing: {e}")
+        logger.warning("Error parsing job listing: %s", e)
         return None
 
 
+def page_url(page_num: int) -> str:
+    """
+    Build the listing URL for a page number.
+    
+    Args:
+        page_num: Page number (1-based)
+    
+    Returns:
+        Absolute URL of the listing page
+    """
+    if page_num == 1:
+        return BASE_URL
+    return f"{BASE_URL}/page/{page_num}/"
+
+
+def fetch_listing(page_num: int):
+    """
+    Fetch a listing page over plain HTTP.
+    
+    Args:
+        page_num: Page number to fetch
+    
+    Returns:
+        BeautifulSoup object, or None if the request failed
+    """
+    _LIMITER.acquire()
+    return fetch_html(page_url(page_num))
+
+
+def get_total_pages_from_soup(soup) -> int:
+    """
+    Extract the total number of pages from the pagination links.
+    
+    Args:
+        soup: BeautifulSoup object of a listing page
+    
+    Returns:
+        Total number of pages (default 1 if not found)
+    """
+    page_numbers = [
+        int(text)
+        for text in (link.get_text(strip=True) for link in soup.select(".pagination .page-numbers"))
+        if text.isdigit()
+    ]
+    
+    if page_numbers:
+        total = max(page_numbers)
+        logger.info("Found %s total pages", total)
+        return total
+    
+    logger.warning("Could not determine total pages, defaulting to 1")
+    return 1
+
+
+def parse_job_records(records: List[Dict[str, Optional[str]]], page_num: int) -> List[Dict[str, str]]:
+    """
+    Build jobs from the raw listing records of one page.
+    
+    Args:
+        records: Raw listing fields, one dict per job article
+        page_num: Page number (for logging)
+    
+    Returns:
+        List of job dictionaries
+    """
+    jobs = []
+    logger.info("Found %s job listings on page %s", len(records), page_num)
+    
+    # Parse each job against one reference time for the whole page
+    now = datetime.now()
+    for idx, record in enumerate(records, 1):
+        job = parse_job_listing(record, now)
+        if job:
+            jobs.append(job)
+        
+        # Log progress every 10 jobs
+        if idx % 10 == 0:
+            logger.debug("Processed %s/%s jobs...", idx, len(records))
+    
+    logger.info("✓ Successfully parsed %s jobs from page %s", len(jobs), page_num)
+    return jobs
+
+
+def listing_records(soup) -> List[Dict[str, Optional[str]]]:
+    """
+    Extract the raw fields of every job article on a listing page.
+    
+    Args:
+        soup: BeautifulSoup object of the listing page
+    
+    Returns:
+        List of raw listing records (see extract_listing_fields)
+    """
+    return [extract_listing_fields(article) for article in soup.select("article.loadmore-item.noo_job")]
+
+
+def parse_listing_page(soup, page_num: int) -> List[Dict[str, str]]:
+    """
+    Parse all job listings from a fetched listing page.
+    
+    Args:
+        soup: BeautifulSoup object of the listing page
+        page_num: Page number (for logging)
+    
+    Returns:
+        List of job dictionaries
+    """
+    return parse_job_records(listing_records(soup), page_num)
+
+
 def scrape_page(driver: webdriver.Chrome, page_num: int) -> List[Dict[str, str]]:
     """
     Scrape all job listings from a single page.
@@ -304,13 +529,10 @@ def scrape_page(driver: webdriver.Chrome, page_num: int) -> List[Dict[str, str]]
     jobs = []
     
     try:
-        # Construct page URL
-        if page_num == 1:
-            url = BASE_URL
-        else:
-            url = f"{BASE_URL}/page/{page_num}/"
+        url = page_url(page_num)
         
-        print(f"[Scraper] Loading page {page_num}: {url}")
+        logger.info("Loading page %s: %s", page_num, url)
+        _LIMITER.acquire()
         driver.get(url)
         
         # Wait for job listings to load
@@ -319,59 +541,122 @@ def scrape_page(driver: webdriver.Chrome, page_num: int) -> List[Dict[str, str]]
                 EC.presence_of_element_located((By.CSS_SELECTOR, "article.loadmore-item"))
             )
         except TimeoutException:
-            print(f"[Warning] Timeout waiting for jobs on page {page_num}")
+            logger.warning("Timeout waiting for jobs on page %s", page_num)
             return jobs
         
-        # Small delay to ensure dynamic content loads
-        time.sleep(1)
+        # Wait for the late-rendered posted dates rather than a fixed delay;
+        # on timeout extract anyway (only those dates may be missing)
+        try:
+            WebDriverWait(driver, CONTENT_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "article.loadmore-item.noo_job span.job-date-ago"))
+            )
+        except TimeoutException:
+            logger.debug("Posted dates not rendered on page %s, extracting anyway", page_num)
+        
+        # Extract every listing's fields in the browser with a single
+        # WebDriver call instead of one round-trip per field
+        records = driver.execute_script(LISTING_FIELDS_JS) or []
+        jobs = parse_job_records(records, page_num)
+    
+    except Exception as e:
+        logger.error("Failed to scrape page %s: %s", page_num, e)
+    
+    return jobs
+
+
+def iter_http_pages(max_pages: Optional[int] = MAX_PAGES) -> Iterator[List[Dict[str, str]]]:
+    """
+    Scrape listing pages over plain HTTP (no browser), one page at a time.
+    
+    Args:
+        max_pages: Maximum number of pages to scrape (None for all pages)
+    
+    Yields:
+        List of raw job dictionaries for each page
+    """
+    total_jobs = 0
+    
+    try:
+        # Load first page to get total pages
+        logger.info("Loading homepage: %s", BASE_URL)
+        first_page = fetch_listing(1)
+        if not first_page:
+            logger.error("Failed to fetch homepage")
+            return
         
-        # Find all job articles
-        articles = driver.find_elements(By.CSS_SELECTOR, "article.loadmore-item.noo_job")
-        print(f"[Scraper] Found {len(articles)} job listings on page {page_num}")
+        # Get total pages
+        total_pages = get_total_pages_from_soup(first_page)
         
-        # Parse each job
-        for idx, article in enumerate(articles, 1):
-            job = parse_job_listing(article)
-            if job:
-                jobs.append(job)
+        # Determine how many pages to scrape
+        if max_pages:
+            pages_to_scrape = min(max_pages, total_pages)
+        else:
+            pages_to_scrape = total_pages
+        
+        logger.info("Will scrape %s page(s)", pages_to_scrape)
+        logger.info("=" * 70)
+        
+        # Scrape each page
+        cache = PageCache('jobsinnamibia', limiter=_LIMITER)
+        for page_num in range(1, pages_to_scrape + 1):
+            logger.info("Processing page %s/%s...", page_num, pages_to_scrape)
+            
+            jobs = []
+            if page_num == 1:
+                jobs = parse_listing_page(first_page, page_num)
+                first_page = None  # Not needed any more
+            else:
+                # Later pages rarely change between runs; reuse their
+                # extracted records when the server says they are unchanged
+                url = page_url(page_num)
+                content, records = cache.fetch(url)
+                if content is not None:
+                    records = listing_records(BeautifulSoup(content, HTML_PARSER))
+                    cache.store(url, records)
+                
+                if records is not None:
+                    jobs = parse_job_records(records, page_num)
+                else:
+                    logger.warning("Failed to fetch page %s", page_num)
             
-            # Log progress every 10 jobs
-            if idx % 10 == 0:
-                print(f"[Scraper] Processed {idx}/{len(articles)} jobs...")
+            total_jobs += len(jobs)
+            logger.info("Total jobs collected so far: %s", total_jobs)
+            yield jobs
         
-        print(f"[Scraper] ✓ Successfully parsed {len(jobs)} jobs from page {page_num}")
+        cache.save()
+        
+        logger.info("=" * 70)
+        logger.info("✓ Scraping complete! Total jobs: %s", total_jobs)
     
+    except KeyboardInterrupt:
+        logger.info("Scraping interrupted by user")
     except Exception as e:
-        print(f"[Error] Failed to scrape page {page_num}: {e}")
-    
-    return jobs
+        logger.error("Scraping failed: %s", e)
 
 
-def scrape(max_pages: Optional[int] = MAX_PAGES) -> List[Dict[str, str]]:
+def iter_selenium_pages(max_pages: Optional[int] = MAX_PAGES) -> Iterator[List[Dict[str, str]]]:
     """
-    Main scraping function - scrapes job listings from JobsInNamibia.info.
+    Scrape listing pages with a headless Chrome browser, one page at a time.
     
     Args:
         max_pages: Maximum number of pages to scrape (None for all pages)
     
-    Returns:
-        List of normalized opportunity dictionaries
+    Yields:
+        List of raw job dictionaries for each page
     """
-    print("[Scraper] Starting JobsInNamibia.info scraper...")
-    print(f"[Scraper] Target: {BASE_URL}")
-    print("[Scraper] Purpose: Academic research - Youth unemployment study")
-    print(f"[Scraper] Max pages: {max_pages or 'ALL (639+)'}")
+    if not SELENIUM_AVAILABLE:
+        logger.error("Selenium is not installed; run: pip install selenium")
+        return
     
-    all_jobs = []
-    driver = None
+    total_jobs = 0
     
     try:
-        # Set up Selenium driver
-        print("[Scraper] Initializing Chrome WebDriver (headless mode)...")
-        driver = setup_driver(headless=True)
+        # Reuse the browser from a previous run if there is one
+        driver = get_driver()
         
         # Load first page to get total pages
-        print(f"[Scraper] Loading homepage: {BASE_URL}")
+        logger.info("Loading homepage: %s", BASE_URL)
+        _LIMITER.acquire()
         driver.get(BASE_URL)
         
         # Get total pages
@@ -383,45 +668,101 @@ def scrape(max_pages: Optional[int] = MAX_PAGES) -> List[Dict[str, str]]:
         else:
             pages_to_scrape = total_pages
         
-        print(f"[Scraper] Will scrape {pages_to_scrape} page(s)")
-        print("=" * 70)
+        logger.info("Will scrape %s page(s)", pages_to_scrape)
+        logger.info("=" * 70)
         
         # Scrape each page
         for page_num in range(1, pages_to_scrape + 1):
-            print(f"\n[Scraper] Processing page {page_num}/{pages_to_scrape}...")
+            logger.info("Processing page %s/%s...", page_num, pages_to_scrape)
             
             jobs = scrape_page(driver, page_num)
-            all_jobs.extend(jobs)
-            
-            print(f"[Scraper] Total jobs collected so far: {len(all_jobs)}")
             
-            # Rate limiting - wait before next page
-            if page_num < pages_to_scrape:
-                print(f"[Scraper] Waiting {PAGE_LOAD_DELAY}s before next page (rate limiting)...")
-                time.sleep(PAGE_LOAD_DELAY)
+            total_jobs += len(jobs)
+            logger.info("Total jobs collected so far: %s", total_jobs)
+            yield jobs
         
-        print("\n" + "=" * 70)
-        print(f"[Scraper] ✓ Scraping complete! Total jobs: {len(all_jobs)}")
+        logger.info("=" * 70)
+        logger.info("✓ Scraping complete! Total jobs: %s", total_jobs)
     
     except KeyboardInterrupt:
-        print("\n[Info] Scraping interrupted by user")
+        logger.info("Scraping interrupted by user")
+    except WebDriverException as e:
+        # The browser may have crashed; start a fresh one next time
+        logger.error("Scraping failed: %s", e)
+        _shutdown_driver()
     except Exception as e:
-        print(f"[Error] Scraping failed: {e}")
-    finally:
-        # Always close the driver
-        if driver:
-            print("[Scraper] Closing Chrome WebDriver...")
-            driver.quit()
+        logger.error("Scraping failed: %s", e)
+
+
+def iter_scrape(max_pages: Optional[int] = MAX_PAGES, use_selenium: bool = False) -> Iterator[Dict[str, str]]:
+    """
+    Scrape job listings from JobsInNamibia.info, yielding as each page completes.
+    
+    Only one page of jobs is held in memory at a time.
     
-    # Normalize all opportunities
-    print("[Scraper] Normalizing opportunities...")
-    normalized = [normalize_opportunity(job) for job in all_jobs]
+    Args:
+        max_pages: Maximum number of pages to scrape (None for all pages)
+        use_selenium: Render pages in headless Chrome instead of plain HTTP
     
-    return normalized
+    Yields:
+        Normalized opportunity dictionaries
+    """
+    logger.info("Starting JobsInNamibia.info scraper...")
+    logger.info("Target: %s", BASE_URL)
+    logger.info("Purpose: Academic research - Youth unemployment study")
+    logger.info("Max pages: %s", max_pages or 'ALL (639+)')
+    logger.info("Mode: %s", 'Selenium' if use_selenium else 'HTTP')
+    
+    pages = iter_selenium_pages(max_pages) if use_selenium else iter_http_pages(max_pages)
+    
+    # Normalize each page's opportunities as it arrives, skipping jobs
+    # already seen on an earlier page (listings shift while paginating)
+    seen = set()
+    for jobs in pages:
+        fresh = []
+        for job in jobs:
+            if job["id"] in seen:
+                continue
+            seen.add(job["id"])
+            fresh.append(job)
+        
+        # One batch call per page shares the per-run setup across rows
+        yield from normalize_opportunities(fresh)
+
+
+def scrape(max_pages: Optional[int] = MAX_PAGES, use_selenium: bool = False) -> List[Dict[str, str]]:
+    """
+    Main scraping function - scrapes job listings from JobsInNamibia.info.
+    
+    Args:
+        max_pages: Maximum number of pages to scrape (None for all pages)
+        use_selenium: Render pages in headless Chrome instead of plain HTTP
+    
+    Returns:
+        List of normalized opportunity dictionaries
+    """
+    return list(iter_scrape(max_pages, use_selenium))
+
+
+def scrape_to_file(path: str, max_pages: Optional[int] = MAX_PAGES, use_selenium: bool = False) -> Optional[int]:
+    """
+    Scrape job listings straight to a newline-delimited JSON file.
+    
+    Args:
+        path: Output .jsonl file path
+        max_pages: Maximum number of pages to scrape (None for all pages)
+        use_selenium: Render pages in headless Chrome instead of plain HTTP
+    
+    Returns:
+        Number of opportunities written, or None if writing failed
+    """
+    return write_jsonl(iter_scrape(max_pages, use_selenium), path)
 
 
 # Test harness
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='[Scraper] %(message)s', stream=sys.stdout)
+    
     print("=" * 70)
     print("JobsInNamibia.info Scraper - Test Run")
     print("=" * 70)
@@ -431,7 +772,7 @@ if __name__ == "__main__":
     print("=" * 70)
     
     # Run scraper (limit to 2 pages for testing)
-    opportunities = scrape(max_pages=2)
+    opportunities = scrape(max_pages=2, use_selenium="--use-selenium" in sys.argv)
     
     if opportunities:
         print("\n" + "=" * 70)
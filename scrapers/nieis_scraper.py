@@ -9,54 +9,88 @@ in Havana with Tailored Opportunities"
 
 Focus: Windhoek jobs (relevant to Havana, Karas region)
 Legal: Complies with robots.txt, Terms of Service, and Namibian Data Protection Act
-Ethics: Rate-limited (5-10s delays), non-commercial research use only
+Ethics: Rate-limited (at most 6 page requests per minute, 3 at a time), non-commercial research use only
 """
 
+import logging
 import re
-import time
-from typing import List, Dict, Optional
+import sys
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime, timedelta
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse, parse_qs
 
 from base_scraper import (
+    HTML_PARSER,
+    PageCache,
+    RateLimiter,
     fetch_html,
     clean_text,
     generate_id,
-    format_location
+    format_location,
+    write_jsonl
 )
 
 
-def parse_relative_date(date_text: str) -> str:
+# Module logger; run_all.py (or the test harness below) configures output
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+BASE_URL = 'https://nieis.namibiaatwork.gov.na'
+MAX_PAGES = 5  # Limit to 5 pages to respect rate limits
+PAGE_CONCURRENCY = 3  # Pages fetched in parallel after the first
+REQUESTS_PER_MINUTE = 6  # Token-bucket rate limit (bursts up to this many)
+
+_LIMITER = RateLimiter(REQUESTS_PER_MINUTE, 60)
+
+# Pages after the first only need the results table and the pagination bar
+_RESULTS_CLASSES = frozenset({'searchResultsJobs', 'pageNavigation'})
+_RESULTS_STRAINER = SoupStrainer(
+    class_=lambda classes: classes is not None and not _RESULTS_CLASSES.isdisjoint(classes.split())
+)
+
+# Relative date patterns, checked in order; each maps (now, match) to a datetime
+_RELATIVE_DATE_PATTERNS = (
+    (re.compile(r'(\d+)\s*hour'), lambda now, m: now - timedelta(hours=int(m.group(1)))),
+    (re.compile(r'(\d+)\s*day'), lambda now, m: now - timedelta(days=int(m.group(1)))),
+    (re.compile(r'(\d+)\s*week'), lambda now, m: now - timedelta(weeks=int(m.group(1)))),
+    (re.compile(r'(\d+)\s*month'), lambda now, m: now - timedelta(days=int(m.group(1)) * 30)),
+    (re.compile(r'yesterday'), lambda now, m: now - timedelta(days=1)),
+    (re.compile(r'today'), lambda now, m: now),
+)
+
+# Label of the pagination bar's link to the final page
+_LAST_LINK_RE = re.compile(r'\blast\b', re.IGNORECASE)
+
+# City names looked for in a job row's text
+_CITY_RE = re.compile(r'\b(Windhoek|Swakopmund|Walvis Bay|Oshakati|Rundu|Katima Mulilo|Rehoboth|Keetmanshoop)\b')
+
+
+def parse_relative_date(date_text: str, now: Optional[datetime] = None) -> str:
     """
     Parse relative dates like "1 hour(s) ago" to ISO date
     
     Args:
         date_text: Relative date string
+        now: Reference time (default: the current time)
         
     Returns:
         ISO format date string
     """
+    if now is None:
+        now = datetime.now()
+    
     if not date_text:
-        return datetime.now().strftime('%Y-%m-%d')
+        return now.strftime('%Y-%m-%d')
     
     date_lower = date_text.lower().strip()
-    now = datetime.now()
     
     # Parse patterns like "X hour(s) ago", "X day(s) ago", etc.
-    patterns = [
-        (r'(\d+)\s*hour', lambda m: now - timedelta(hours=int(m.group(1)))),
-        (r'(\d+)\s*day', lambda m: now - timedelta(days=int(m.group(1)))),
-        (r'(\d+)\s*week', lambda m: now - timedelta(weeks=int(m.group(1)))),
-        (r'(\d+)\s*month', lambda m: now - timedelta(days=int(m.group(1)) * 30)),
-        (r'yesterday', lambda m: now - timedelta(days=1)),
-        (r'today', lambda m: now),
-    ]
-    
-    for pattern, calculator in patterns:
-        match = re.search(pattern, date_lower)
+    for pattern, calculator in _RELATIVE_DATE_PATTERNS:
+        match = pattern.search(date_lower)
         if match:
             try:
-                date = calculator(match)
+                date = calculator(now, match)
                 return date.strftime('%Y-%m-%d')
             except:
                 continue
@@ -93,16 +127,71 @@ def extract_search_id(soup) -> Optional[str]:
     return None
 
 
-def parse_job_listing(job_row, base_url: str) -> Optional[Dict]:
+def get_last_page(soup) -> Optional[int]:
+    """
+    Find the page number of the pagination bar's "Last" link
+    
+    Numbered links are not used: a windowed pager only shows the pages
+    near the current one, so the highest of them need not be the last.
+    
+    Args:
+        soup: BeautifulSoup object of a results page
+        
+    Returns:
+        Last page number, or None if the bar has no "Last" link
+    """
+    nav_div = soup.find('div', class_='pageNavigation')
+    if not nav_div:
+        return None
+    
+    last_link = nav_div.find('a', href=True, string=_LAST_LINK_RE)
+    if not last_link:
+        return None
+    
+    page = parse_qs(urlparse(last_link['href']).query).get('page', [''])[0]
+    return int(page) if page.isdigit() else None
+
+
+def build_page_url(start_url: str, page_num: int, search_id: Optional[str]) -> str:
+    """
+    Build the URL of a results page
+    
+    Args:
+        start_url: URL of the first results page
+        page_num: Page number (1-based)
+        search_id: searchId from the first page, if found
+        
+    Returns:
+        Page URL
+    """
+    if page_num == 1:
+        return start_url
+    
+    params = [
+        f'page={page_num}',
+        'view=list',
+        'listings_per_page=50',  # Get more results per page
+    ]
+    if search_id:
+        params.insert(1, f'searchId={search_id}')
+        params.append('action=search')
+    
+    return f"{start_url}?{'&'.join(params)}"
+
+
+def extract_listing_fields(job_row, base_url: str) -> Optional[Dict]:
     """
-    Parse a single job listing from a table row
+    Pull the fields of a single job listing out of a table row
+    
+    The posted date is kept as the site's relative text ("2 days ago") so
+    cached records can be resolved against the time of each run.
     
     Args:
         job_row: BeautifulSoup <tr> element
         base_url: Base URL for constructing absolute URLs
         
     Returns:
-        Dictionary with job data or None if parsing fails
+        Dictionary of listing fields (see build_job) or None if parsing fails
     """
     try:
         # Find the panel div
@@ -126,18 +215,9 @@ def parse_job_listing(job_row, base_url: str) -> Optional[Dict]:
         if company_link:
             company = clean_text(company_link.get_text())
         
-        # Extract location from the col-md-8 or col-md-4 div
-        location = "Windhoek"  # Default for this page
-        col_divs = job_row.find_all('div', class_=re.compile(r'col-md-\d+'))
-        for div in col_divs:
-            text = div.get_text()
-            # Look for location patterns (city names in Namibia)
-            cities = ['Windhoek', 'Swakopmund', 'Walvis Bay', 'Oshakati', 'Rundu', 'Katima Mulilo', 'Rehoboth', 'Keetmanshoop']
-            for city in cities:
-                if city in text:
-                    # Just use the city name, don't include any following text
-                    location = city
-                    break
+        # Extract location (first Namibian city mentioned in the row)
+        match = _CITY_RE.search(job_row.get_text(" ", strip=True))
+        location = match.group(1) if match else "Windhoek"  # Default for this page
         
         location = format_location(location)
         
@@ -157,148 +237,263 @@ def parse_job_listing(job_row, base_url: str) -> Optional[Dict]:
         if not description:
             description = f"Job opportunity at {company} in {location}"
         
-        # Extract date
-        date_posted = datetime.now().strftime('%Y-%m-%d')
+        # Extract the relative posted date text
+        posted = None
         date_span = job_row.find('span', string=re.compile(r'ago|hour|day|week'))
         if date_span:
-            date_text = date_span.get_text()
-            date_posted = parse_relative_date(date_text)
+            posted = date_span.get_text()
         else:
             # Try to find date in icon elements
             clock_icon = job_row.find('i', class_='fa-clock-o')
             if clock_icon and clock_icon.parent:
-                date_text = clock_icon.parent.get_text()
-                date_posted = parse_relative_date(date_text)
+                posted = clock_icon.parent.get_text()
         
-        # Create opportunity object
-        opportunity = {
-            'id': generate_id(title, 'NIEIS', detail_url),
-            'source': 'NIEIS',
+        return {
             'title': title,
-            'type': 'Job',  # NIEIS is primarily a job portal
+            'url': detail_url,
             'organization': company,
             'location': location,
             'description': description,
-            'url': detail_url,
-            'date_posted': date_posted,
-            'verified': True
+            'posted': posted,
         }
         
-        return opportunity
-        
     except Exception as e:
-        print(f"[Scraper] ⚠ Error parsing job listing: {str(e)}")
+        logger.warning("⚠ Error parsing job listing: %s", e)
         return None
 
 
-def scrape() -> List[Dict]:
+def build_job(record: Dict, now: Optional[datetime] = None) -> Dict:
     """
-    Scrape job opportunities from NIEIS Windhoek page
+    Build an opportunity from the fields of a single listing
     
+    Args:
+        record: Listing fields from extract_listing_fields()
+        now: Reference time for relative dates (default: the current time)
+        
     Returns:
-        List of opportunity dictionaries
+        Opportunity dictionary
+    """
+    return {
+        'id': generate_id(record['title'], 'NIEIS', record['url']),
+        'source': 'NIEIS',
+        'title': record['title'],
+        'type': 'Job',  # NIEIS is primarily a job portal
+        'organization': record['organization'],
+        'location': record['location'],
+        'description': record['description'],
+        'url': record['url'],
+        'date_posted': parse_relative_date(record['posted'], now),
+        'verified': True
+    }
+
+
+def parse_results_page(soup) -> Optional[Dict]:
     """
-    print("[Scraper] Running nieis_scraper.py...")
-    print("[Scraper] Target: NIEIS Windhoek jobs")
-    print("[Scraper] Purpose: Academic research - Youth unemployment study")
+    Extract every job row on a results page
     
-    base_url = 'https://nieis.namibiaatwork.gov.na'
-    start_url = f'{base_url}/browse-by-city/windhoek/'
+    Args:
+        soup: BeautifulSoup object of a results page
+        
+    Returns:
+        Dictionary with 'rows' (row count), 'records' (listing fields, see
+        extract_listing_fields) and 'has_next' (whether a Next link
+        exists), or None if the page has no jobs table
+    """
+    # Find the jobs table
+    jobs_tbody = soup.find('tbody', class_='searchResultsJobs')
+    if not jobs_tbody:
+        return None
     
-    opportunities = []
-    max_pages = 5  # Limit to 5 pages to respect rate limits
+    # Find all job rows and extract each one
+    job_rows = jobs_tbody.find_all('tr', class_=re.compile(r'(evenrow|oddrow)'))
+    records = [record for record in (extract_listing_fields(row, BASE_URL) for row in job_rows) if record]
+    
+    # Check for next page link
+    nav_div = soup.find('div', class_='pageNavigation')
+    has_next = False
+    if nav_div:
+        next_link = nav_div.find('a', string=re.compile(r'Next|›|»', re.IGNORECASE))
+        has_next = next_link is not None
+    
+    return {'rows': len(job_rows), 'records': records, 'has_next': has_next}
+
+
+def parse_page_html(html: bytes) -> Optional[Dict]:
+    """
+    Parse a raw results page, building only the results table and the
+    pagination bar (see parse_results_page)
+    
+    Args:
+        html: Raw page body
+        
+    Returns:
+        parse_results_page() result for the page
+    """
+    return parse_results_page(BeautifulSoup(html, HTML_PARSER, parse_only=_RESULTS_STRAINER))
+
+
+def fetch_result_pages(cache: PageCache, page_urls: List[str]) -> List[Optional[Dict]]:
+    """
+    Fetch and parse results pages through the page cache
+    
+    Pages unchanged since the last run come back already parsed; the rest
+    are parsed and remembered for next time. The caller saves the cache.
+    
+    Args:
+        cache: Page cache to fetch through
+        page_urls: URLs of the pages to fetch, in page order
+        
+    Returns:
+        parse_results_page() result for each page, up to (not including)
+        the first page that failed to fetch
+    """
+    fetched = cache.fetch_batch(page_urls, max_workers=PAGE_CONCURRENCY)
+    
+    results = []
+    for url, (html, cached) in zip(page_urls, fetched):
+        if html is None and cached is None:
+            break
+        if html is not None:
+            cached = parse_page_html(html)
+            cache.store(url, cached)
+        else:
+            logger.info("✓ Reused unchanged page from cache: %s", url)
+        results.append(cached)
+    
+    return results
+
+
+def iter_scrape() -> Iterator[Dict]:
+    """
+    Scrape job opportunities from NIEIS Windhoek page, yielding page by page
+    
+    Yields:
+        Opportunity dictionaries
+    """
+    logger.info("Running nieis_scraper.py...")
+    logger.info("Target: NIEIS Windhoek jobs")
+    logger.info("Purpose: Academic research - Youth unemployment study")
+    
+    start_url = f'{BASE_URL}/browse-by-city/windhoek/'
+    
+    total = 0
+    seen = set()
     
     # Fetch first page to get searchId
-    print(f"[Scraper] Fetching initial page: {start_url}")
+    logger.info("Fetching initial page: %s", start_url)
+    _LIMITER.acquire()
     soup = fetch_html(start_url)
     
     if not soup:
-        print("[Scraper] ✗ Failed to fetch initial page")
-        return []
+        logger.error("✗ Failed to fetch initial page")
+        return
     
     # Extract searchId for pagination
     search_id = extract_search_id(soup)
     if search_id:
-        print(f"[Scraper] ✓ Extracted searchId: {search_id}")
+        logger.info("✓ Extracted searchId: %s", search_id)
     else:
-        print("[Scraper] ⚠ Could not extract searchId, will try without it")
+        logger.warning("⚠ Could not extract searchId, will try without it")
+    
+    # Later pages are only requested while the previous one links to a
+    # next page, as a results page without a Next link is the last one
+    first_result = parse_results_page(soup)
+    page_results = [first_result]
+    max_pages = MAX_PAGES
+    
+    if first_result and first_result['rows'] and first_result['has_next']:
+        # Cache entries hold each page's listing records, with the posted
+        # dates left as relative text to be resolved on every run
+        cache = PageCache('nieis_records', limiter=_LIMITER)
+        
+        last_page = get_last_page(soup)
+        if last_page:
+            # The pager says how many pages exist, so fetch the rest
+            # concurrently (bounded) and let their network latency overlap
+            max_pages = min(max_pages, last_page)
+            page_urls = [build_page_url(start_url, page_num, search_id) for page_num in range(2, max_pages + 1)]
+            logger.info("Fetching %s more page(s), %s at a time...", len(page_urls), PAGE_CONCURRENCY)
+            page_results += fetch_result_pages(cache, page_urls)
+        else:
+            # Without a Last link, follow Next one page at a time
+            for page_num in range(2, max_pages + 1):
+                results = fetch_result_pages(cache, [build_page_url(start_url, page_num, search_id)])
+                page_results += results
+                if not results or not results[0] or not results[0]['rows'] or not results[0]['has_next']:
+                    break
+        
+        cache.save()
     
     # Process pages
     for page_num in range(1, max_pages + 1):
-        print(f"\n[Scraper] Processing page {page_num}/{max_pages}...")
+        logger.info("Processing page %s/%s...", page_num, max_pages)
         
-        # Construct page URL
-        if page_num == 1:
-            page_url = start_url
-            current_soup = soup  # Use already fetched first page
-        else:
-            # Build pagination URL
-            params = [
-                f'page={page_num}',
-                'view=list',
-                'listings_per_page=50',  # Get more results per page
-            ]
-            if search_id:
-                params.insert(1, f'searchId={search_id}')
-                params.append('action=search')
-            
-            page_url = f"{start_url}?{'&'.join(params)}"
-            
-            # Rate limiting - be respectful (5-10 seconds between requests)
-            delay = 7  # 7 seconds delay
-            print(f"[Scraper] Waiting {delay}s before next request (rate limiting)...")
-            time.sleep(delay)
-            
-            current_soup = fetch_html(page_url)
-            if not current_soup:
-                print(f"[Scraper] ✗ Failed to fetch page {page_num}, stopping")
-                break
-        
-        # Find the jobs table
-        jobs_tbody = current_soup.find('tbody', class_='searchResultsJobs')
-        
-        if not jobs_tbody:
-            print(f"[Scraper] ⚠ No jobs table found on page {page_num}")
+        if page_num > len(page_results):
+            logger.error("✗ Failed to fetch page %s, stopping", page_num)
             break
         
-        # Find all job rows
-        job_rows = jobs_tbody.find_all('tr', class_=re.compile(r'(evenrow|oddrow)'))
+        result = page_results[page_num - 1]
         
-        if not job_rows:
-            print(f"[Scraper] ⚠ No job listings found on page {page_num}, stopping")
+        if result is None:
+            logger.warning("⚠ No jobs table found on page %s", page_num)
             break
         
-        print(f"[Scraper] Found {len(job_rows)} job listings on page {page_num}")
+        if not result['rows']:
+            logger.warning("⚠ No job listings found on page %s, stopping", page_num)
+            break
         
-        # Parse each job
-        page_count = 0
-        for row in job_rows:
-            job = parse_job_listing(row, base_url)
-            if job:
-                opportunities.append(job)
-                page_count += 1
+        logger.info("Found %s job listings on page %s", result['rows'], page_num)
+        logger.info("✓ Successfully parsed %s jobs from page %s", len(result['records']), page_num)
         
-        print(f"[Scraper] ✓ Successfully parsed {page_count} jobs from page {page_num}")
+        # Resolve relative dates now rather than when the page was parsed,
+        # since the records may come from an earlier run's cache. One
+        # reference time per page keeps its dates consistent.
+        now = datetime.now()
         
-        # Check for next page link
-        nav_div = current_soup.find('div', class_='pageNavigation')
-        has_next = False
-        if nav_div:
-            next_link = nav_div.find('a', string=re.compile(r'Next|›|»', re.IGNORECASE))
-            has_next = next_link is not None
+        # Skip jobs repeated from an earlier page
+        for record in result['records']:
+            job = build_job(record, now)
+            if job['id'] in seen:
+                continue
+            seen.add(job['id'])
+            total += 1
+            yield job
         
-        if not has_next and page_num < max_pages:
-            print(f"[Scraper] ℹ No 'Next' link found, reached last page")
+        if not result['has_next'] and page_num < max_pages:
+            logger.info("ℹ No 'Next' link found, reached last page")
             break
     
-    print(f"\n[Scraper] nieis_scraper.py completed")
-    print(f"[Scraper] Total opportunities collected: {len(opportunities)}")
+    logger.info("nieis_scraper.py completed")
+    logger.info("Total opportunities collected: %s", total)
+
+
+def scrape() -> List[Dict]:
+    """
+    Scrape job opportunities from NIEIS Windhoek page
+    
+    Returns:
+        List of opportunity dictionaries
+    """
+    return list(iter_scrape())
+
+
+def scrape_to_file(path: str) -> Optional[int]:
+    """
+    Scrape job opportunities straight to a newline-delimited JSON file
     
-    return opportunities
+    Args:
+        path: Output .jsonl file path
+        
+    Returns:
+        Number of opportunities written, or None if writing failed
+    """
+    return write_jsonl(iter_scrape(), path)
 
 
 if __name__ == '__main__':
     """Test the scraper independently"""
+    logging.basicConfig(level=logging.INFO, format='[Scraper] %(message)s', stream=sys.stdout)
+    
     print("=" * 70)
     print("NIEIS Scraper - Test Run")
     print("=" * 70)
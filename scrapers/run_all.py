@@ -5,129 +5,540 @@ Runs all scrapers, merges results, and writes to opportunities.json
 
 import os
 import sys
+import asyncio
 import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
-import traceback
+from operator import itemgetter
+from types import ModuleType
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple
 
 # Add current directory to Python path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from base_scraper import (
+    get_session,
+    matches_normalized,
     normalize_opportunity,
-    remove_duplicates,
-    validate_opportunity,
+    remove_near_duplicates,
+    validate_opportunities,
+    warm_session,
     write_json
 )
 
+SKIP_MODULES = {'base_scraper.py', 'run_all.py'}  # Python files that are not scrapers
+MAX_PARALLEL_SCRAPERS = 16  # Scrapers are network-bound, so threads overlap their waits
 
-def discover_scrapers() -> List[str]:
+# Scrapers that spend most of their time parsing rather than waiting on
+# the network can set `PARALLEL_MODE = 'process'` to run outside the GIL
+PROCESS_MODE = 'process'
+
+# Module logger; output is configured by configure_logging()
+logger = logging.getLogger(__name__)
+
+# Pass as `extra` to log a line without the [Scraper] prefix
+_PLAIN = {'plain': True}
+
+
+class _ScraperFormatter(logging.Formatter):
+    """Prefix log lines with [Scraper] unless logged with extra=_PLAIN"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        return message if getattr(record, 'plain', False) else f"[Scraper] {message}"
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Send all log records through a queue to a single writer thread
+    
+    Scrapers log from many threads at once; with a QueueHandler each
+    call only enqueues the record, and the listener thread does all the
+    writing to stdout in order.
+    
+    Returns:
+        The started listener; call stop() before exiting to flush it
+    """
+    log_queue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_ScraperFormatter())
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+def _init_worker_logging() -> None:
+    """Process pool initializer: log straight to stdout in the same format"""
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_ScraperFormatter())
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(stream_handler)
+
+
+def discover_scrapers() -> List[Tuple[str, str]]:
     """
     Discover all scraper modules in the scrapers directory
     
     Returns:
-        List of scraper module names (without .py extension)
+        Sorted list of (module name without .py extension, file path)
+    """
+    scraper_dir = os.path.dirname(__file__) or '.'
+    
+    # scandir reports the entry type from the directory listing itself,
+    # so no extra stat call is needed per file
+    with os.scandir(scraper_dir) as entries:
+        return sorted(
+            (entry.name[:-3], entry.path)
+            for entry in entries
+            if entry.name.endswith('.py')
+            and not entry.name.startswith('__')
+            and entry.name not in SKIP_MODULES
+            and entry.is_file()
+        )
+
+
+def _load_scraper(module_name: str, path: Optional[str] = None) -> ModuleType:
+    """
+    Import a scraper module
+    
+    discover_scrapers() already knows where each file is, so the module is
+    loaded straight from its path instead of searching sys.path for it.
+    Loaded modules are registered in sys.modules and reused.
+    
+    Args:
+        module_name: Name of the scraper module
+        path: Path to the module's .py file, if known
+        
+    Returns:
+        The imported module
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    if path is None:
+        return importlib.import_module(module_name)
+    
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def _scrape_kwargs(scrape_func: Callable) -> Dict:
+    """
+    Keyword arguments to pass to a scraper's entry point
+    
+    Scrapers that accept a `session` parameter get the shared keep-alive
+    session from base_scraper, so even modules that issue their own
+    requests reuse its pooled connections instead of opening new ones.
+    
+    Args:
+        scrape_func: The module's scrape() or scrape_async()
+        
+    Returns:
+        Keyword arguments for the call
+    """
+    try:
+        parameters = inspect.signature(scrape_func).parameters
+    except (TypeError, ValueError):
+        return {}
+    return {'session': get_session()} if 'session' in parameters else {}
+
+
+def _finish_run(module_name: str, opportunities, start_time: float) -> tuple[List[Dict], float]:
     """
-    scraper_dir = os.path.dirname(__file__)
-    scrapers = []
+    Validate and report a scraper's result
     
-    for filename in os.listdir(scraper_dir):
-        # Skip non-Python files and special files
-        if not filename.endswith('.py'):
-            continue
-        if filename.startswith('__'):
-            continue
-        if filename in ['base_scraper.py', 'run_all.py']:
-            continue
+    Args:
+        module_name: Name of the scraper module
+        opportunities: Whatever the scraper returned
+        start_time: time.perf_counter() reading when the scraper started
         
-        # Add scraper module name (without .py)
-        module_name = filename[:-3]
-        scrapers.append(module_name)
+    Returns:
+        Tuple of (opportunities list, duration in seconds)
+    """
+    # Validate the return type
+    if not isinstance(opportunities, list):
+        logger.error("✗ %s did not return a list", module_name)
+        return [], 0
+    
+    # Calculate duration
+    duration = round(time.perf_counter() - start_time, 6)
     
-    return sorted(scrapers)
+    # One record per block, so lines from concurrent scrapers cannot interleave
+    logger.info("\n".join([
+        f"✓ {module_name} completed in {duration:.2f}s",
+        f"  Returned {len(opportunities)} items",
+    ]))
+    
+    return opportunities, duration
+
+
+def _fail_run(module_name: str, error: Exception, start_time: float) -> tuple[List[Dict], float]:
+    """
+    Report a scraper that raised
+    
+    Args:
+        module_name: Name of the scraper module
+        error: The exception raised
+        start_time: time.perf_counter() reading when the scraper started
+        
+    Returns:
+        Tuple of (empty list, duration in seconds)
+    """
+    duration = round(time.perf_counter() - start_time, 6)
+    logger.error("\n".join([
+        f"✗ {module_name} failed after {duration:.2f}s",
+        f"  Error: {error}",
+        "  Traceback:",
+    ]), exc_info=(type(error), error, error.__traceback__))
+    return [], duration
 
 
-def run_scraper(module_name: str) -> tuple[List[Dict], float]:
+def run_scraper(module_name: str, path: Optional[str] = None) -> tuple[List[Dict], float]:
     """
     Run a single scraper module
     
     Args:
         module_name: Name of the scraper module
+        path: Path to the module's .py file, if known
         
     Returns:
         Tuple of (opportunities list, duration in seconds)
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         # Import the scraper module
-        scraper_module = importlib.import_module(module_name)
+        scraper_module = _load_scraper(module_name, path)
         
         # Check if it has a scrape() function
         if not hasattr(scraper_module, 'scrape'):
-            print(f"[Scraper] ⚠ {module_name} has no scrape() function, skipping")
+            logger.warning("⚠ %s has no scrape() function, skipping", module_name)
             return [], 0
         
         # Run the scraper
-        print(f"\n[Scraper] Starting {module_name}...")
-        opportunities = scraper_module.scrape()
+        logger.info("Starting %s...", module_name)
+        opportunities = scraper_module.scrape(**_scrape_kwargs(scraper_module.scrape))
         
-        # Validate the return type
-        if not isinstance(opportunities, list):
-            print(f"[Scraper] ✗ {module_name} did not return a list")
-            return [], 0
+        return _finish_run(module_name, opportunities, start_time)
         
-        # Calculate duration
-        duration = (datetime.now() - start_time).total_seconds()
+    except Exception as e:
+        return _fail_run(module_name, e, start_time)
+
+
+def _get_scrape_async(module_name: str, path: Optional[str] = None) -> Optional[Callable[[], Awaitable[List[Dict]]]]:
+    """Return the module's scrape_async() coroutine function, if it has one"""
+    try:
+        return getattr(_load_scraper(module_name, path), 'scrape_async', None)
+    except Exception:
+        # run_scraper() reports import errors
+        return None
+
+
+def _get_parallel_mode(module_name: str, path: Optional[str] = None) -> str:
+    """Return the module's PARALLEL_MODE ('thread' unless it declares otherwise)"""
+    try:
+        return getattr(_load_scraper(module_name, path), 'PARALLEL_MODE', 'thread')
+    except Exception:
+        # run_scraper() reports import errors
+        return 'thread'
+
+
+def _get_base_url(module_name: str, path: Optional[str] = None) -> Optional[str]:
+    """Return the module's BASE_URL, if it declares one"""
+    try:
+        return getattr(_load_scraper(module_name, path), 'BASE_URL', None)
+    except Exception:
+        # run_scraper() reports import errors
+        return None
+
+
+def _process_context():
+    """
+    Multiprocessing context for the scraper process pool
+    
+    The pool is started while the event loop and thread pool are running,
+    and forking a process that has live threads can deadlock the child,
+    so prefer a fork server (or a fresh interpreter) over a plain fork.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+async def run_scraper_async(module_name: str, executor: Executor, path: Optional[str] = None) -> tuple[List[Dict], float]:
+    """
+    Run a single scraper module on the event loop
+    
+    Scrapers may expose `async def scrape_async()`, which is awaited
+    directly (see base_scraper.fetch_html_async). Plain scrape() scrapers
+    run in the executor so they still overlap with everything else.
+    
+    Args:
+        module_name: Name of the scraper module
+        executor: Thread or process pool for synchronous scrapers
+        path: Path to the module's .py file, if known
         
-        print(f"[Scraper] ✓ {module_name} completed in {duration:.2f}s")
-        print(f"[Scraper]   Returned {len(opportunities)} items")
+    Returns:
+        Tuple of (opportunities list, duration in seconds)
+    """
+    scrape_async = _get_scrape_async(module_name, path)
+    start_time = time.perf_counter()
+    
+    if scrape_async is None:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, run_scraper, module_name, path)
+        except Exception as e:
+            # run_scraper() reports its own errors; this is the executor
+            # failing, e.g. an unpicklable result or a broken process pool
+            return _fail_run(module_name, e, start_time)
+    
+    try:
+        logger.info("Starting %s (async)...", module_name)
+        opportunities = await scrape_async(**_scrape_kwargs(scrape_async))
         
-        return opportunities, duration
+        return _finish_run(module_name, opportunities, start_time)
         
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print(f"[Scraper] ✗ {module_name} failed after {duration:.2f}s")
-        print(f"[Scraper]   Error: {str(e)}")
-        print(f"[Scraper]   Traceback:")
-        traceback.print_exc()
-        return [], duration
+        return _fail_run(module_name, e, start_time)
 
 
-def aggregate_opportunities(all_opportunities: List[Dict]) -> List[Dict]:
+async def run_all_scrapers(
+    scrapers: List[Tuple[str, str]],
+    on_result: Callable[[str, List[Dict]], None]
+) -> Dict[str, float]:
     """
-    Clean, normalize, and deduplicate all opportunities
+    Run every scraper concurrently
+    
+    Synchronous scrapers run on a thread pool, except those declaring
+    `PARALLEL_MODE = 'process'`, which get a process pool so CPU-bound
+    parsing is not serialized by the GIL. Their scrape() must return
+    picklable data. The shared session is warmed for the BASE_URL of
+    every scraper that runs in this process while the scrapers start.
     
     Args:
-        all_opportunities: Combined list from all scrapers
+        scrapers: (module name, file path) pairs from discover_scrapers()
+        on_result: Called on the event loop with (module name, opportunities)
+            as soon as each scraper finishes
         
     Returns:
-        Cleaned and deduplicated list
+        Dictionary of module name -> duration in seconds
     """
-    print(f"\n[Scraper] Aggregating {len(all_opportunities)} total items...")
+    process_scrapers = {name for name, path in scrapers if _get_parallel_mode(name, path) == PROCESS_MODE}
+    
+    # Open pooled connections to the in-process scrapers' sites alongside
+    # the scrapers rather than before them, so a slow or unreachable host
+    # (retried by the session) never delays the start of the run.
+    # Process workers have their own sessions.
+    base_urls = (_get_base_url(name, path) for name, path in scrapers if name not in process_scrapers)
+    warm_up = asyncio.ensure_future(asyncio.to_thread(warm_session, list(dict.fromkeys(filter(None, base_urls)))))
+    
+    process_executor = None
+    if process_scrapers:
+        process_executor = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(process_scrapers)),
+            mp_context=_process_context(),
+            initializer=_init_worker_logging
+        )
+    
+    # The thread pool only bounds synchronous scrapers; the semaphore also
+    # caps how many scrape_async() coroutines hit the network at once
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_SCRAPERS)
+    
+    async def bounded(name: str, path: str, executor: Executor) -> float:
+        async with semaphore:
+            opportunities, duration = await run_scraper_async(name, executor, path)
+        on_result(name, opportunities)
+        return duration
+    
+    try:
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SCRAPERS, len(scrapers))) as executor:
+            durations = await asyncio.gather(*(
+                bounded(name, path, process_executor if name in process_scrapers else executor)
+                for name, path in scrapers
+            ))
+    finally:
+        if process_executor is not None:
+            process_executor.shutdown()
+        await warm_up
+    
+    return {name: duration for (name, _), duration in zip(scrapers, durations)}
+
+
+def load_previous_opportunities(output_path: str) -> Dict[str, Dict]:
+    """
+    Load the opportunities written by the previous run
+    
+    Args:
+        output_path: Path to opportunities.json
+        
+    Returns:
+        Dictionary of opportunity ID -> opportunity, empty if there is no
+        usable previous output
+    """
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('opportunities') or []
+    except (OSError, ValueError, AttributeError):
+        return {}
+    
+    return {opp['id']: opp for opp in previous if isinstance(opp, dict) and opp.get('id')}
+
+
+class OpportunityCollector:
+    """
+    Normalize, validate and deduplicate scraper results as they arrive
+    
+    Work is done as each scraper finishes, while the others are still
+    waiting on the network, and raw lists are dropped once consumed.
+    Results are consumed in scraper discovery order (buffering any that
+    finish early), so which copy of a duplicate is kept does not depend
+    on which scraper happened to finish first.
+    """
+    
+    def __init__(self, order: Optional[List[str]] = None, previous: Optional[Dict[str, Dict]] = None):
+        """
+        Args:
+            order: Scraper module names in the order their results are
+                consumed; None consumes results in the order they are added
+            previous: Opportunities from the last run, by ID (see
+                load_previous_opportunities); unchanged items are reused
+                without normalizing them again
+        """
+        self._order = order
+        self._next = 0
+        self._pending: Dict[str, List[Dict]] = {}
+        self._previous = previous or {}
+        self._unique: Dict[str, Dict] = {}
+        self.total = 0
+        self.valid = 0
+        self.reused = 0
+    
+    def add(self, module_name: str, opportunities: List[Dict]) -> None:
+        """
+        Add one scraper's results
+        
+        Args:
+            module_name: Name of the scraper module
+            opportunities: Raw opportunities it returned
+        """
+        if self._order is None:
+            self._consume(opportunities)
+            return
+        
+        self._pending[module_name] = opportunities
+        while self._next < len(self._order) and self._order[self._next] in self._pending:
+            self._consume(self._pending.pop(self._order[self._next]))
+            self._next += 1
     
-    # Normalize all opportunities
-    normalized = []
-    for opp in all_opportunities:
+    def _normalize(self, opp: Dict) -> Optional[Dict]:
+        """Normalize one item, reusing the previous run's copy if unchanged"""
         try:
-            norm_opp = normalize_opportunity(opp)
-            if validate_opportunity(norm_opp):
-                normalized.append(norm_opp)
-            else:
-                print(f"[Scraper] ⚠ Skipping invalid opportunity: {opp.get('title', 'Unknown')}")
+            prev_opp = self._previous.get(opp.get('id'))
+            if prev_opp is not None and matches_normalized(opp, prev_opp):
+                self.reused += 1
+                return prev_opp
+            return normalize_opportunity(opp)
         except Exception as e:
-            print(f"[Scraper] ⚠ Error normalizing opportunity: {str(e)}")
-            continue
+            logger.warning("⚠ Error normalizing opportunity: %s", e)
+            return None
     
-    print(f"[Scraper] {len(normalized)} opportunities passed validation")
-    
-    # Remove duplicates
-    unique = remove_duplicates(normalized)
+    def _consume(self, opportunities: List[Dict]) -> None:
+        """Normalize, validate and deduplicate one batch (first ID wins)"""
+        self.total += len(opportunities)
+        
+        candidates = [norm_opp for norm_opp in map(self._normalize, opportunities) if norm_opp is not None]
+        valid, invalid = validate_opportunities(candidates)
+        
+        for norm_opp in invalid:
+            logger.warning("⚠ Skipping invalid opportunity: %s", norm_opp.get('title') or 'Unknown')
+        self.valid += len(valid)
+        
+        unique = self._unique
+        for opp in valid:
+            opp_id = opp.get('id')
+            if opp_id and opp_id not in unique:
+                unique[opp_id] = opp
     
-    # Sort by date (newest first)
-    unique.sort(key=lambda x: x.get('date_posted', ''), reverse=True)
+    def finish(self, near_dedup: bool = False) -> List[Dict]:
+        """
+        Return the collected opportunities
+        
+        Args:
+            near_dedup: Also drop near-identical postings mirrored across sources
+            
+        Returns:
+            Cleaned and deduplicated list, newest first
+        """
+        # Results held back behind a scraper that never reported
+        for module_name in (self._order or [])[self._next:]:
+            if module_name in self._pending:
+                self._consume(self._pending.pop(module_name))
+        self._next = len(self._order or [])
+        
+        logger.info("Aggregated %d total items", self.total)
+        if self.reused:
+            logger.info("Reused %d unchanged opportunities from the previous run", self.reused)
+        logger.info("%d opportunities passed validation", self.valid)
+        logger.info("Removed %d duplicates", self.valid - len(self._unique))
+        
+        unique = list(self._unique.values())
+        
+        # Optionally remove postings that differ only slightly between sources
+        if near_dedup:
+            unique = remove_near_duplicates(unique)
+        
+        # Sort by date (newest first); normalization guarantees every item has
+        # an ISO date_posted, so plain string order is date order
+        unique.sort(key=itemgetter('date_posted'), reverse=True)
+        
+        return unique
+
+
+def aggregate_opportunities(
+    all_opportunities: List[Dict],
+    near_dedup: bool = False,
+    previous: Optional[Dict[str, Dict]] = None
+) -> List[Dict]:
+    """
+    Clean, normalize, and deduplicate all opportunities
     
-    return unique
+    Args:
+        all_opportunities: Combined list from all scrapers
+        near_dedup: Also drop near-identical postings mirrored across sources
+        previous: Opportunities from the last run, by ID (see
+            load_previous_opportunities); unchanged items are reused
+            without normalizing them again
+        
+    Returns:
+        Cleaned and deduplicated list
+    """
+    collector = OpportunityCollector(previous=previous)
+    collector.add('all', all_opportunities)
+    return collector.finish(near_dedup=near_dedup)
 
 
 def get_sources(opportunities: List[Dict]) -> List[str]:
@@ -153,35 +564,55 @@ def main():
     Discovers scrapers, runs them, aggregates results, and writes output
     """
     script_start = datetime.now()
-    print("=" * 70)
-    print("YouthGuide NA - Opportunity Scraper")
-    print("=" * 70)
-    print(f"Started at: {script_start.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    timer_start = time.perf_counter()
+    logger.info("\n".join([
+        "=" * 70,
+        "YouthGuide NA - Opportunity Scraper",
+        "=" * 70,
+        f"Started at: {script_start.strftime('%Y-%m-%d %H:%M:%S')}\n",
+    ]), extra=_PLAIN)
     
     # Discover all scraper modules
     scrapers = discover_scrapers()
     
     if not scrapers:
-        print("[Scraper] ⚠ No scraper modules found!")
-        print("[Scraper] Add scraper files to the /scrapers directory")
+        logger.warning("⚠ No scraper modules found!")
+        logger.warning("Add scraper files to the /scrapers directory")
         sys.exit(1)
     
-    print(f"[Scraper] Found {len(scrapers)} scraper(s): {', '.join(scrapers)}\n")
+    logger.info("Found %d scraper(s): %s", len(scrapers), ', '.join(name for name, _ in scrapers))
     
-    # Run all scrapers
-    all_opportunities = []
-    scraper_stats = {}
+    output_path = os.path.join(
+        os.path.dirname(__file__),
+        '..',
+        'data',
+        'opportunities.json'
+    )
+    output_path = os.path.abspath(output_path)
+    
+    # Clean and deduplicate each scraper's results as soon as it finishes
+    scraper_names = [name for name, _ in scrapers]
+    collector = OpportunityCollector(scraper_names, previous=load_previous_opportunities(output_path))
+    counts = {}
+    
+    def on_result(scraper_name: str, opportunities: List[Dict]) -> None:
+        counts[scraper_name] = len(opportunities)
+        collector.add(scraper_name, opportunities)
     
-    for scraper_name in scrapers:
-        opportunities, duration = run_scraper(scraper_name)
-        all_opportunities.extend(opportunities)
-        scraper_stats[scraper_name] = {
-            'count': len(opportunities),
-            'duration': duration
+    # Run all scrapers concurrently; total time is the slowest scraper
+    # rather than the sum of all of them
+    durations = asyncio.run(run_all_scrapers(scrapers, on_result))
+    
+    scraper_stats = {
+        scraper_name: {
+            'count': counts[scraper_name],
+            'duration': durations[scraper_name]
         }
+        for scraper_name in scraper_names
+    }
     
-    # Aggregate and clean
-    final_opportunities = aggregate_opportunities(all_opportunities)
+    near_dedup = os.environ.get('SCRAPER_NEAR_DEDUP', '').lower() in ('1', 'true', 'yes')
+    final_opportunities = collector.finish(near_dedup=near_dedup)
     
     # Prepare output data
     output_data = {
@@ -193,51 +624,56 @@ def main():
     }
     
     # Write to file
-    output_path = os.path.join(
-        os.path.dirname(__file__),
-        '..',
-        'data',
-        'opportunities.json'
-    )
-    output_path = os.path.abspath(output_path)
+    logger.info("Writing to %s...", output_path)
+    json_written = write_json(output_data, output_path, pretty=True)
     
-    print(f"\n[Scraper] Writing to {output_path}...")
-    success = write_json(output_data, output_path, pretty=True)
+    # Compact gzip copy for consumers that read the data over the network
+    gzip_path = output_path + '.gz'
+    gzip_written = write_json(output_data, gzip_path, pretty=False, compress=True)
+    success = json_written and gzip_written
     
     # Print summary
     script_end = datetime.now()
-    total_duration = (script_end - script_start).total_seconds()
-    
-    print("\n" + "=" * 70)
-    print("SCRAPING SUMMARY")
-    print("=" * 70)
-    print(f"Total scrapers run: {len(scrapers)}")
-    print(f"Total items scraped: {len(all_opportunities)}")
-    print(f"Final unique items: {len(final_opportunities)}")
-    print(f"Sources: {', '.join(output_data['sources'])}")
-    print(f"Total duration: {total_duration:.2f}s")
-    print(f"Output file: {output_path}")
-    print(f"File written: {'✓ Yes' if success else '✗ Failed'}")
-    
-    print("\nPer-scraper stats:")
-    for scraper_name, stats in scraper_stats.items():
-        print(f"  • {scraper_name}: {stats['count']} items in {stats['duration']:.2f}s")
+    total_duration = time.perf_counter() - timer_start
     
-    print("\n" + "=" * 70)
-    print(f"Completed at: {script_end.strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70)
+    summary = [
+        "\n" + "=" * 70,
+        "SCRAPING SUMMARY",
+        "=" * 70,
+        f"Total scrapers run: {len(scrapers)}",
+        f"Total items scraped: {collector.total}",
+        f"Final unique items: {len(final_opportunities)}",
+        f"Sources: {', '.join(output_data['sources'])}",
+        f"Total duration: {total_duration:.2f}s",
+        f"Output file: {output_path}",
+        f"File written: {'✓ Yes' if json_written else '✗ Failed'}",
+        f"Compressed file written: {'✓ Yes' if gzip_written else '✗ Failed'}",
+        "\nPer-scraper stats:",
+    ]
+    for scraper_name, stats in scraper_stats.items():
+        summary.append(f"  • {scraper_name}: {stats['count']} items in {stats['duration']:.2f}s")
+    summary += [
+        "\n" + "=" * 70,
+        f"Completed at: {script_end.strftime('%Y-%m-%d %H:%M:%S')}",
+        "=" * 70,
+    ]
+    logger.info("\n".join(summary), extra=_PLAIN)
     
     # Exit with appropriate code
     sys.exit(0 if success else 1)
 
 
 if __name__ == '__main__':
+    # Send our own and library log records to stdout through one writer
+    listener = configure_logging()
+    
     try:
         main()
     except KeyboardInterrupt:
-        print("\n[Scraper] ⚠ Interrupted by user")
+        logger.warning("⚠ Interrupted by user")
         sys.exit(130)
     except Exception as e:
-        print(f"\n[Scraper] ✗ Fatal error: {str(e)}")
-        traceback.print_exc()
+        logger.exception("✗ Fatal error: %s", e)
         sys.exit(1)
+    finally:
+        listener.stop()
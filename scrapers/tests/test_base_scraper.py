@@ -0,0 +1,238 @@
+"""
+Tests for base_scraper helpers
+"""
+
+import json
+
+import pytest
+
+import base_scraper
+from base_scraper import extract_date, format_location, get_opportunity_type, today_iso, write_json
+
+OPPORTUNITY = {
+    'id': 'abc123',
+    'title': 'Junior Développeur',
+    'tags': ['python', 'sql'],
+    'meta': {'remote': False, 'salary': None},
+}
+
+PAYLOADS = {
+    'empty': {},
+    'empty_list': {'total_count': 0, 'opportunities': []},
+    'single_item': {'total_count': 1, 'opportunities': [OPPORTUNITY]},
+    'multi_item': {
+        'last_updated': '2025-10-17T00:00:00',
+        'sources': ['A', 'B'],
+        'scraper_stats': {'a': {'count': 2, 'duration': 0.5}},
+        'opportunities': [OPPORTUNITY, {**OPPORTUNITY, 'id': 'def456', 'tags': []}],
+    },
+}
+
+
+def _stdlib_dumps(data, pretty):
+    """The reference encoding write_json has to reproduce"""
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@pytest.mark.parametrize('pretty', [True, False], ids=['pretty', 'compact'])
+@pytest.mark.parametrize('name', PAYLOADS)
+def test_stdlib_chunks_match_json_dumps(name, pretty):
+    data = PAYLOADS[name]
+    chunks = b''.join(base_scraper._iter_stdlib_json_chunks(data, pretty))
+    assert chunks == _stdlib_dumps(data, pretty)
+
+
+@pytest.mark.parametrize('pretty', [True, False], ids=['pretty', 'compact'])
+@pytest.mark.parametrize('name', PAYLOADS)
+def test_orjson_chunks_match_orjson_dumps(name, pretty):
+    orjson = pytest.importorskip('orjson')
+    data = PAYLOADS[name]
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+
+    chunks = b''.join(base_scraper._iter_json_chunks(data, option, pretty))
+    assert chunks == orjson.dumps(data, option=option)
+    # Both encoders must produce the same file
+    assert chunks == _stdlib_dumps(data, pretty)
+
+
+@pytest.mark.parametrize('pretty', [True, False], ids=['pretty', 'compact'])
+@pytest.mark.parametrize('name', PAYLOADS)
+def test_write_json_bytes(tmp_path, name, pretty):
+    data = PAYLOADS[name]
+    path = tmp_path / 'out.json'
+
+    assert write_json(data, str(path), pretty=pretty)
+    assert path.read_bytes() == _stdlib_dumps(data, pretty)
+
+
+@pytest.mark.parametrize('pretty', [True, False], ids=['pretty', 'compact'])
+def test_write_json_bytes_without_orjson(tmp_path, monkeypatch, pretty):
+    monkeypatch.setattr(base_scraper, 'orjson', None)
+    data = PAYLOADS['multi_item']
+    path = tmp_path / 'out.json'
+
+    assert write_json(data, str(path), pretty=pretty)
+    assert path.read_bytes() == _stdlib_dumps(data, pretty)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Sales Assistant', 'Job'),
+    ('Graduate Internship Programme', 'Internship'),
+    ('Bursary for intern nurses', 'Internship'),
+    ('Training course with bursary', 'Scholarship'),
+    ('Research Grant', 'Scholarship'),
+    ('Welding Workshop', 'Training'),
+    ('CERTIFICATION Course', 'Training'),
+])
+def test_get_opportunity_type_precedence(text, expected):
+    assert get_opportunity_type(text) == expected
+
+
+@pytest.mark.parametrize('location, expected', [
+    ('', 'Namibia'),
+    ('   ', 'Namibia'),
+    ('WHK', 'Windhoek'),
+    ('  swk ', 'Swakopmund'),
+    ('Katutura, Wdh', 'Katutura, Windhoek'),
+    ('<b>osh</b>', 'Oshakati'),
+    # Abbreviations only match whole words
+    ('Walvis Bay', 'Walvis Bay'),
+    ('Katutura', 'Katutura'),
+    ('Rundu Rural', 'Rundu Rural'),
+])
+def test_format_location(location, expected):
+    assert format_location(location) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Closing date: 15/03/2025', '2025-03-15'),
+    ('5-3-2025', '2025-03-05'),
+    ('Posted 2025-3-7', '2025-03-07'),
+    ('Posted: March 5, 2025', '2025-03-05'),
+    ('sep 12 2025', '2025-09-12'),
+    ('From 01/02/2025 to 2025-12-31', '2025-02-01'),
+])
+def test_extract_date_patterns(text, expected):
+    assert extract_date(text) == expected
+
+
+def test_extract_date_fallbacks():
+    assert extract_date('') is None
+    assert extract_date('posted recently') == today_iso()
+
+
+class _FakeResponse:
+    def __init__(self, status_code=200, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise base_scraper.requests.exceptions.HTTPError(self.status_code)
+
+
+class _FakeSession:
+    """Serves queued responses and records the headers of each request"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+def _page_cache(tmp_path, monkeypatch, *responses):
+    session = _FakeSession(*responses)
+    monkeypatch.setattr(base_scraper, '_SESSION', session)
+    return base_scraper.PageCache('test', cache_dir=str(tmp_path)), session
+
+
+def test_page_cache_miss_returns_content(tmp_path, monkeypatch):
+    cache, _ = _page_cache(tmp_path, monkeypatch, _FakeResponse(content=b'<html>'))
+    assert cache.fetch('https://example.com/2') == (b'<html>', None)
+
+
+def test_page_cache_not_modified_reuses_parsed(tmp_path, monkeypatch):
+    url = 'https://example.com/2'
+    cache, _ = _page_cache(tmp_path, monkeypatch, _FakeResponse(
+        content=b'<html>', headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 13 Oct 2025 08:00:00 GMT'}
+    ))
+    cache.fetch(url)
+    cache.store(url, ['parsed'])
+    assert cache.save()
+
+    cache, session = _page_cache(tmp_path, monkeypatch, _FakeResponse(status_code=304))
+    assert cache.fetch(url) == (None, ['parsed'])
+    assert session.sent_headers == [{
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 13 Oct 2025 08:00:00 GMT',
+    }]
+
+
+def test_page_cache_same_content_reuses_parsed(tmp_path, monkeypatch):
+    url = 'https://example.com/2'
+    cache, _ = _page_cache(tmp_path, monkeypatch, _FakeResponse(content=b'<html>'))
+    cache.fetch(url)
+    cache.store(url, ['parsed'])
+    cache.save()
+
+    # No validators were stored, so the body is re-sent and matched by hash
+    cache, session = _page_cache(tmp_path, monkeypatch, _FakeResponse(content=b'<html>'))
+    assert cache.fetch(url) == (None, ['parsed'])
+    assert session.sent_headers == [{}]
+
+
+def test_page_cache_changed_content_is_returned(tmp_path, monkeypatch):
+    url = 'https://example.com/2'
+    cache, _ = _page_cache(tmp_path, monkeypatch, _FakeResponse(content=b'<html>'))
+    cache.fetch(url)
+    cache.store(url, ['parsed'])
+    cache.save()
+
+    cache, _ = _page_cache(tmp_path, monkeypatch, _FakeResponse(content=b'<html>new'))
+    assert cache.fetch(url) == (b'<html>new', None)
+
+
+def test_page_cache_save_prunes_unseen_and_unparsed_pages(tmp_path, monkeypatch):
+    cache, _ = _page_cache(
+        tmp_path, monkeypatch,
+        _FakeResponse(content=b'a'), _FakeResponse(content=b'b'), _FakeResponse(content=b'c'),
+    )
+    for url in ('https://example.com/a', 'https://example.com/b', 'https://example.com/c'):
+        cache.fetch(url)
+    cache.store('https://example.com/a', ['a'])
+    cache.store('https://example.com/b', ['b'])
+    cache.save()
+
+    # Only /a is requested in the next run; /b must not be carried over
+    cache, _ = _page_cache(tmp_path, monkeypatch, _FakeResponse(content=b'a'))
+    cache.fetch('https://example.com/a')
+    cache.save()
+
+    saved = json.loads((tmp_path / 'test.json').read_bytes())
+    assert list(saved) == ['https://example.com/a']
+    assert saved['https://example.com/a']['parsed'] == ['a']
+
+
+def test_page_cache_failed_request(tmp_path, monkeypatch):
+    cache, _ = _page_cache(tmp_path, monkeypatch, _FakeResponse(status_code=500))
+    assert cache.fetch('https://example.com/2') == (None, None)
+
+
+def test_fetch_content_batch_keeps_url_order(monkeypatch):
+    class _ByUrlSession:
+        def get(self, url, timeout=None):
+            return _FakeResponse(status_code=404 if url.endswith('missing') else 200, content=url.encode())
+
+    monkeypatch.setattr(base_scraper, '_SESSION', _ByUrlSession())
+    urls = [f'https://example.com/{page}' for page in ('a', 'missing', 'b', 'c')]
+
+    assert base_scraper.fetch_content_batch(urls, max_workers=3) == [
+        b'https://example.com/a', None, b'https://example.com/b', b'https://example.com/c',
+    ]
+    assert base_scraper.fetch_content_batch([]) == []
@@ -0,0 +1,36 @@
+"""
+Tests for jobsinnamibia_scraper parsing helpers
+"""
+
+from datetime import datetime
+
+import pytest
+
+from jobsinnamibia_scraper import _COMMON_POSTED, parse_posted_ago
+
+NOW = datetime(2025, 10, 17, 9, 30)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('', '2025-10-17'),
+    ('today', '2025-10-17'),
+    ('5 hours ago', '2025-10-17'),
+    ('10 hours ago', '2025-10-16'),
+    ('1 day ago', '2025-10-16'),
+    ('  3 Days Ago ', '2025-10-14'),
+    ('2 weeks ago', '2025-10-03'),
+    ('1 month ago', '2025-09-17'),
+    ('45 days ago', '2025-09-02'),
+    # Not a relative date the site uses; falls back to today
+    ('yesterday', '2025-10-17'),
+    ('recently', '2025-10-17'),
+])
+def test_parse_posted_ago(text, expected):
+    assert parse_posted_ago(text, NOW) == expected
+
+
+def test_common_posted_matches_regex_path(monkeypatch):
+    # The lookup table must only be a shortcut, never a different answer
+    expected = {text: parse_posted_ago(text, NOW) for text in _COMMON_POSTED}
+    monkeypatch.setattr('jobsinnamibia_scraper._COMMON_POSTED', {})
+    assert {text: parse_posted_ago(text, NOW) for text in expected} == expected
@@ -0,0 +1,166 @@
+"""
+Tests for nieis_scraper parsing and pagination
+"""
+
+from datetime import datetime
+
+import pytest
+from bs4 import BeautifulSoup
+
+import nieis_scraper
+from nieis_scraper import parse_page_html, parse_relative_date
+
+NOW = datetime(2025, 10, 17, 9, 30)
+
+
+def _row(job_id, body=''):
+    return (
+        '<tr class="evenrow"><td><div class="panel">'
+        f'<a class="btn" href="/display-job/{job_id}/Job.html">Job {job_id}</a>'
+        f'</div>{body}</td></tr>'
+    )
+
+
+def _page(job_ids, nav=''):
+    rows = ''.join(_row(job_id) for job_id in job_ids)
+    return (
+        f'<table><tbody class="searchResultsJobs">{rows}</tbody></table>'
+        f'<div class="pageNavigation">{nav}</div>'
+    )
+
+
+def _link(page, label):
+    return f'<a href="/browse-by-city/windhoek/?page={page}&searchId=42">{label}</a>'
+
+
+class _FakePageCache:
+    """Serves pages by number and records every requested URL"""
+
+    pages = {}
+    requested = []
+
+    def __init__(self, name, limiter=None):
+        pass
+
+    def fetch_batch(self, urls, max_workers=8):
+        self.requested.extend(urls)
+        results = []
+        for url in urls:
+            page = int(url.split('page=')[1].split('&')[0])
+            html = self.pages.get(page)
+            results.append((html.encode() if html else None, None))
+        return results
+
+    def store(self, url, parsed):
+        pass
+
+    def save(self):
+        return True
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('', '2025-10-17'),
+    ('5 hour(s) ago', '2025-10-17'),
+    ('10 hours ago', '2025-10-16'),
+    ('2 day(s) ago', '2025-10-15'),
+    ('1 week ago', '2025-10-10'),
+    ('2 months ago', '2025-08-18'),
+    ('Yesterday', '2025-10-16'),
+    ('Today', '2025-10-17'),
+    ('recently', '2025-10-17'),
+])
+def test_parse_relative_date(text, expected):
+    assert parse_relative_date(text, NOW) == expected
+
+
+def test_parse_page_html_reads_listing_fields():
+    body = (
+        '<div class="col-md-8"><a href="/company/7/">ACME Ltd</a>\n'
+        'Walvis Bay and Windhoek\nCook meals for guests\n'
+        '<span><i class="fa fa-clock-o"></i> 2 day(s) ago</span></div>'
+    )
+    html = (
+        f'<table><tbody class="searchResultsJobs">{_row(1, body)}</tbody></table>'
+        f'<div class="pageNavigation">{_link(2, "Next")}</div>'
+    )
+    result = parse_page_html(html.encode())
+
+    assert result['rows'] == 1
+    assert result['has_next']
+    record = result['records'][0]
+    assert record['organization'] == 'ACME Ltd'
+    # The first city mentioned in the row wins
+    assert record['location'] == 'Walvis Bay'
+    assert record['posted'].strip() == '2 day(s) ago'
+    assert nieis_scraper.build_job(record, NOW)['date_posted'] == '2025-10-15'
+
+
+def test_parse_page_html_matches_full_parse():
+    body = '<div class="col-md-8"><a href="/company/7/">ACME Ltd</a>\nRundu\n<span>3 hours ago</span></div>'
+    html = (
+        '<html><head><title>Jobs in Windhoek</title></head><body>'
+        '<div class="sidebar"><a href="/company/1/">Other Co</a> Oshakati</div>'
+        f'<table><tbody class="searchResultsJobs">{_row(1, body)}{_row(2)}</tbody></table>'
+        f'<div class="pageNavigation">{_link(2, "2")}{_link(2, "Next")}</div>'
+        '<footer>Keetmanshoop office</footer></body></html>'
+    )
+
+    # The strainer only skips building subtrees the parser never reads
+    full = nieis_scraper.parse_results_page(BeautifulSoup(html, nieis_scraper.HTML_PARSER))
+    assert parse_page_html(html.encode()) == full
+    assert full['rows'] == 2 and full['has_next']
+    # Only the row's own text is searched for a city, defaulting to Windhoek
+    assert [record['location'] for record in full['records']] == ['Rundu', 'Windhoek']
+
+
+def test_parse_page_html_without_results_table():
+    assert parse_page_html(b'<html><body><p>Maintenance</p></body></html>') is None
+
+
+def _scrape(monkeypatch, pages):
+    monkeypatch.setattr(_FakePageCache, 'pages', pages)
+    monkeypatch.setattr(_FakePageCache, 'requested', [])
+    monkeypatch.setattr(nieis_scraper, 'PageCache', _FakePageCache)
+    monkeypatch.setattr(nieis_scraper, 'fetch_html', lambda url: BeautifulSoup(pages[1], 'html.parser'))
+    monkeypatch.setattr(nieis_scraper._LIMITER, 'acquire', lambda: 0.0)
+
+    jobs = nieis_scraper.scrape()
+    return [job['title'] for job in jobs], _FakePageCache.requested
+
+
+def test_single_page_result_fetches_no_more_pages(monkeypatch):
+    titles, requested = _scrape(monkeypatch, {1: _page([1, 2])})
+
+    assert titles == ['Job 1', 'Job 2']
+    assert requested == []
+
+
+def test_windowed_pager_follows_next_links(monkeypatch):
+    titles, requested = _scrape(monkeypatch, {
+        1: _page([1], _link(2, '2') + _link(2, 'Next')),
+        2: _page([2], _link(3, '3') + _link(3, 'Next')),
+        3: _page([3], _link(2, '2')),
+    })
+
+    assert titles == ['Job 1', 'Job 2', 'Job 3']
+    assert [url.split('?')[1].split('&')[0] for url in requested] == ['page=2', 'page=3']
+
+
+def test_jobs_repeated_on_later_pages_are_skipped(monkeypatch):
+    titles, _ = _scrape(monkeypatch, {
+        1: _page([1, 2], _link(2, 'Next')),
+        2: _page([2, 3, 1]),
+    })
+
+    assert titles == ['Job 1', 'Job 2', 'Job 3']
+
+
+def test_last_link_caps_concurrent_fetch(monkeypatch):
+    titles, requested = _scrape(monkeypatch, {
+        1: _page([1], _link(2, 'Next') + _link(3, 'Last')),
+        2: _page([2], _link(3, 'Next') + _link(3, 'Last')),
+        3: _page([3]),
+    })
+
+    assert titles == ['Job 1', 'Job 2', 'Job 3']
+    assert len(requested) == 2
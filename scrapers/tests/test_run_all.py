@@ -0,0 +1,149 @@
+"""
+Tests for run_all aggregation
+"""
+
+import asyncio
+
+import run_all
+from base_scraper import normalize_opportunity
+from run_all import OpportunityCollector, aggregate_opportunities, run_all_scrapers
+
+
+def _raw(opp_id, title, **fields):
+    return {
+        'id': opp_id,
+        'title': title,
+        'source': 'Test Site',
+        'url': f'https://example.com/{opp_id}',
+        'date_posted': '2025-10-01',
+        **fields,
+    }
+
+
+def test_aggregate_skips_items_that_are_not_dicts():
+    result = aggregate_opportunities([None, _raw('a', 'Job A'), 'junk'])
+    assert [opp['id'] for opp in result] == ['a']
+
+
+def test_unchanged_item_reuses_previous_record():
+    raw = _raw('a', 'Job A', description='Same text')
+    previous = {'a': normalize_opportunity(raw)}
+
+    collector = OpportunityCollector(previous=previous)
+    collector.add('all', [dict(raw)])
+    result = collector.finish()
+
+    assert result[0] is previous['a']
+    assert collector.reused == 1
+
+
+def test_changed_field_is_not_reused():
+    previous = {'a': normalize_opportunity(_raw('a', 'Job A', description='Old text'))}
+
+    collector = OpportunityCollector(previous=previous)
+    collector.add('all', [_raw('a', 'Job A', description='New text', location='Windhoek')])
+    result = collector.finish()
+
+    assert collector.reused == 0
+    assert result[0]['description'] == 'New text'
+    assert result[0]['location'] == 'Windhoek'
+
+
+def test_raw_value_needing_cleanup_is_not_reused():
+    previous = {'a': normalize_opportunity(_raw('a', 'Job A'))}
+
+    collector = OpportunityCollector(previous=previous)
+    collector.add('all', [_raw('a', '  Job   A ')])
+    result = collector.finish()
+
+    assert collector.reused == 0
+    assert result[0]['title'] == 'Job A'
+
+
+def test_process_scraper_failure_is_isolated(tmp_path):
+    good = tmp_path / 'good_scraper.py'
+    good.write_text("def scrape():\n    return [{'title': 'ok', 'source': 'x'}]\n")
+    unpicklable = tmp_path / 'lock_scraper.py'
+    unpicklable.write_text(
+        "import threading\n"
+        "PARALLEL_MODE = 'process'\n"
+        "def scrape():\n"
+        "    return [threading.Lock()]\n"
+    )
+    results = {}
+
+    durations = asyncio.run(run_all_scrapers(
+        [('good_scraper', str(good)), ('lock_scraper', str(unpicklable))],
+        results.__setitem__
+    ))
+
+    assert set(durations) == {'good_scraper', 'lock_scraper'}
+    assert results == {'good_scraper': [{'title': 'ok', 'source': 'x'}], 'lock_scraper': []}
+
+
+def test_session_is_warmed_for_in_process_scrapers(tmp_path, monkeypatch):
+    thread = tmp_path / 'site_scraper.py'
+    thread.write_text("BASE_URL = 'https://site.example'\ndef scrape():\n    return []\n")
+    mirror = tmp_path / 'mirror_scraper.py'
+    mirror.write_text("BASE_URL = 'https://site.example'\ndef scrape():\n    return []\n")
+    process = tmp_path / 'cpu_scraper.py'
+    process.write_text(
+        "BASE_URL = 'https://cpu.example'\n"
+        "PARALLEL_MODE = 'process'\n"
+        "def scrape():\n"
+        "    return []\n"
+    )
+    warmed = []
+    monkeypatch.setattr(run_all, 'warm_session', warmed.append)
+
+    asyncio.run(run_all_scrapers(
+        [('site_scraper', str(thread)), ('mirror_scraper', str(mirror)), ('cpu_scraper', str(process))],
+        lambda name, opportunities: None
+    ))
+
+    assert warmed == [['https://site.example']]
+
+
+def test_collector_consumes_in_discovery_order():
+    reused = _raw('r', 'Reused Job', date_posted='2025-09-01')
+    previous = {'r': normalize_opportunity(reused)}
+    collector = OpportunityCollector(['first', 'second', 'third'], previous=previous)
+
+    # Finish in reverse order; 'third' and 'second' wait for 'first'
+    collector.add('third', [_raw('dup', 'Third copy', date_posted='2025-10-03')])
+    collector.add('second', [_raw('dup', 'Second copy', date_posted='2025-10-03'), {'title': ''}])
+    assert collector.total == 0
+
+    collector.add('first', [_raw('b', 'Job B', date_posted='2025-10-02'), dict(reused)])
+    assert collector.total == 5
+
+    result = collector.finish()
+
+    # First copy of a duplicate in discovery order wins, newest first
+    assert [(opp['id'], opp['title']) for opp in result] == [
+        ('dup', 'Second copy'),
+        ('b', 'Job B'),
+        ('r', 'Reused Job'),
+    ]
+    assert result[2] is previous['r']
+    assert collector.reused == 1
+    assert collector.valid == 4
+
+
+def test_collector_finish_flushes_results_held_back():
+    collector = OpportunityCollector(['missing', 'done'])
+    collector.add('done', [_raw('a', 'Job A')])
+
+    assert [opp['id'] for opp in collector.finish()] == ['a']
+
+
+def test_collector_matches_batch_aggregation():
+    batches = {
+        'a': [_raw('x', 'X', date_posted='2025-10-01'), _raw('y', 'Y', date_posted='2025-10-05')],
+        'b': [_raw('y', 'Y again', date_posted='2025-10-05'), _raw('z', 'Z', date_posted='2025-10-01')],
+    }
+    collector = OpportunityCollector(['a', 'b'])
+    collector.add('b', batches['b'])
+    collector.add('a', batches['a'])
+
+    assert collector.finish() == aggregate_opportunities(batches['a'] + batches['b'])
@@ -0,0 +1,102 @@
+"""
+Setup checks for the scrapers
+
+Run from the scrapers directory with `pytest`
+"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+
+
+@pytest.fixture(scope='session')
+def session():
+    """The shared keep-alive session from base_scraper"""
+    from base_scraper import get_session
+    return get_session()
+
+
+@pytest.fixture
+def data_dir():
+    """The data directory opportunities.json is written to, created if missing"""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.abspath(DATA_DIR)
+
+
+def test_python_version():
+    assert sys.version_info >= (3, 9), "Python 3.9+ required"
+
+
+@pytest.mark.parametrize('package', ['requests', 'bs4', 'lxml'])
+def test_required_package(package):
+    try:
+        importlib.import_module(package)
+    except ImportError:
+        pytest.fail(f"{package} not found. Install with: pip install -r requirements.txt")
+
+
+def test_base_scraper_imports():
+    from base_scraper import (  # noqa: F401
+        fetch_html,
+        clean_text,
+        extract_date,
+        generate_id,
+        normalize_opportunity,
+        write_json
+    )
+
+
+def test_shared_session(session):
+    from base_scraper import get_session
+    assert get_session() is session
+    assert session.headers['User-Agent']
+
+
+def test_clean_text():
+    from base_scraper import clean_text
+    assert clean_text("  Hello   World\n\n  ") == "Hello World"
+
+
+def test_generate_id():
+    from base_scraper import generate_id
+    assert len(generate_id("Test Job", "Test Site", "https://test.com")) == 16
+
+
+def test_normalize_opportunity():
+    from base_scraper import normalize_opportunity
+    normalized = normalize_opportunity({
+        'title': 'Test Opportunity',
+        'source': 'Test Site'
+    })
+    assert 'id' in normalized
+    assert 'verified' in normalized
+
+
+def test_example_scraper():
+    import example_scraper
+    results = example_scraper.scrape()
+    assert isinstance(results, list), "Example scraper should return a list"
+    assert len(results) > 0, "Example scraper should return some results"
+
+
+def test_data_directory(data_dir):
+    assert os.path.isdir(data_dir)
+
+
+def test_write_json(data_dir):
+    from base_scraper import write_json
+    test_file = os.path.join(data_dir, 'test.json')
+    test_data = {
+        'test': True,
+        'timestamp': '2025-10-17T00:00:00Z'
+    }
+    try:
+        assert write_json(test_data, test_file), "write_json failed"
+        assert os.path.exists(test_file), "Test file not created"
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)